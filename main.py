@@ -1,16 +1,72 @@
+import argparse
 import asyncio
-from src.cls_bot import Husky
+from src.cls_bot import Husky, ShardedHusky
+from src.launcher import Supervisor
+from src.utils.config import LOOPS, loop_factory
 import json
 
 
-async def main():
-    husky = Husky()
-    env = open("env.json", "r")
-    token = json.load(env)["discord"]["token"]
+async def main(env: dict, shard_count: int | None = None):
+    if shard_count is not None and shard_count > 1:
+        husky = ShardedHusky(env=env, shard_count=shard_count)
+    else:
+        husky = Husky(env=env)
+    token = env["discord"]["token"]
 
     await husky.login(token)
     await husky.connect()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    env = json.load(open("env.json", "r"))
+    sharding = env.get("sharding", {})
+    runtime = env.setdefault("runtime", {})
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=sharding.get("processes", 1),
+        help="number of worker processes to split the shards across",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=sharding.get("shard_count"),
+        help="total shard count (a single unsharded connection if omitted or 1 in single-process mode)",
+    )
+    parser.add_argument(
+        "--loop",
+        choices=LOOPS,
+        default=runtime.get("loop", "asyncio"),
+        help="event loop implementation",
+    )
+    parser.add_argument(
+        "--bench",
+        nargs="*",
+        choices=LOOPS,
+        metavar="LOOP",
+        help="instead of connecting, benchmark event dispatch under each loop (default: all)",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=20_000,
+        help="synthetic events per kind and loop with --bench",
+    )
+    args = parser.parse_args()
+    runtime["loop"] = args.loop
+
+    if args.bench is not None:
+        from src.bench import run_benchmark
+
+        print(run_benchmark(env, args.bench or list(LOOPS), args.events))
+        raise SystemExit
+
+    if args.processes > 1:
+        if args.shards is None:
+            parser.error("--shards (or sharding.shard_count) is required with --processes")
+        Supervisor(env, args.shards, args.processes).run()
+    else:
+        with asyncio.Runner(loop_factory=loop_factory(args.loop)) as runner:
+            runner.run(main(env, args.shards))
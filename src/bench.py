@@ -0,0 +1,267 @@
+import asyncio
+import datetime
+import gc
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from .database.database import TODO
+from .database.database_types import autowrap
+from .utils.config import loop_factory
+from .utils.embeds import EmbedFactory
+from .utils.tracing import LatencyHistogram
+
+BOT = {
+    "id": "999",
+    "username": "husky",
+    "discriminator": "0",
+    "avatar": None,
+    "bot": True,
+}
+USER = {"id": "1000", "username": "bench", "discriminator": "0", "avatar": None}
+CHANNEL_ID = "2000"
+APPLICATION_ID = "3000"
+
+
+class BenchResult(NamedTuple):
+    loop: str
+    kind: str
+    events: int
+    seconds: float
+    latency: LatencyHistogram
+
+    @property
+    def rate(self) -> float:
+        return self.events / self.seconds
+
+
+def message_payload(i: int, content: str) -> dict[str, Any]:
+    return {
+        "id": str(10_000 + i),
+        "channel_id": CHANNEL_ID,
+        "author": USER,
+        "content": content,
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+    }
+
+
+def interaction_payload(i: int, name: str) -> dict[str, Any]:
+    return {
+        "id": str(10_000 + i),
+        "application_id": APPLICATION_ID,
+        "type": 2,
+        "token": "bench",
+        "version": 1,
+        "user": USER,
+        "channel": {"id": CHANNEL_ID, "type": 1},
+        "channel_id": CHANNEL_ID,
+        "attachment_size_limit": 8 * 1024 * 1024,
+        "data": {"id": "4000", "name": name, "type": 1, "options": []},
+    }
+
+
+class _Probe(commands.Cog):
+    """Commands that do nothing but mark when the dispatch reached them."""
+
+    def __init__(self, done: Callable[[int], None]):
+        self.done = done
+
+    @commands.command(name="benchping")
+    async def ping(self, ctx: commands.Context):
+        self.done(ctx.message.id)
+
+    @app_commands.command(name="benchping")
+    async def ping_slash(self, interaction: discord.Interaction):
+        self.done(interaction.id)
+
+
+async def _bench(
+    env: dict[str, Any], loop: str, events: int, concurrency: int
+) -> list[BenchResult]:
+    from .cls_bot import Husky
+
+    husky = Husky(env=env)
+    sent: dict[int, float] = {}
+    latency = LatencyHistogram()
+    idle = asyncio.Event()
+
+    def done(event_id: int) -> None:
+        latency.record(perf_counter() - sent.pop(event_id))
+        if not sent:
+            idle.set()
+
+    await husky.add_cog(_Probe(done))
+    state = husky._connection
+    state.user = discord.ClientUser(state=state, data=BOT)
+    kinds = {
+        "message": (
+            state.parse_message_create,
+            lambda i: message_payload(i, f"{husky.prefix}benchping"),
+        ),
+        "interaction": (
+            state.parse_interaction_create,
+            lambda i: interaction_payload(i, "benchping"),
+        ),
+    }
+
+    results = []
+    async with husky:
+        for kind, (parse, payload) in kinds.items():
+            latency = LatencyHistogram()
+            payloads = [payload(i) for i in range(events)]
+            gc.collect()
+            start = perf_counter()
+            for offset in range(0, events, concurrency):
+                idle.clear()
+                for data in payloads[offset : offset + concurrency]:
+                    sent[int(data["id"])] = perf_counter()
+                    parse(data)
+                await asyncio.wait_for(idle.wait(), timeout=30)
+            results.append(
+                BenchResult(loop, kind, events, perf_counter() - start, latency)
+            )
+    return results
+
+
+def run_benchmark(
+    env: dict[str, Any],
+    loops: list[str],
+    events: int = 20_000,
+    concurrency: int = 100,
+) -> str:
+    """Feeds synthetic MESSAGE_CREATE and INTERACTION_CREATE payloads through the
+    gateway parser and `Husky`'s dispatch, once per event loop implementation, and
+    returns a table of throughput and parse-to-callback latency. Nothing is sent to
+    Discord and no extensions or database are loaded."""
+    logging.getLogger("discord").setLevel(logging.ERROR)
+    results: list[BenchResult] = []
+    for name in loops:
+        factory = loop_factory(name)
+        if name != "asyncio" and factory is None:
+            continue  # not installed; loop_factory already warned
+        with asyncio.Runner(loop_factory=factory) as runner:
+            results.extend(runner.run(_bench(env, name, events, concurrency)))
+
+    lines = [
+        f"{'loop':<10}{'events':<13}{'n':>7}{'events/s':>11}"
+        + "".join(f"{f'p{p}':>10}" for p in (50, 95, 99))
+    ]
+    for r in results:
+        lines.append(
+            f"{r.loop:<10}{r.kind:<13}{r.events:>7}{r.rate:>11.0f}"
+            + "".join(f"{r.latency.percentile(p) * 1000:>8.2f}ms" for p in (50, 95, 99))
+        )
+    return "\n".join(lines)
+
+
+def legacy_embed(user: discord.abc.User, prefix: str) -> discord.Embed:
+    """`HuskyContext.embed` as it was before `EmbedFactory`, for comparison."""
+    embed = discord.Embed(title="title", description="description")
+    embed.timestamp = datetime.datetime.now()
+    embed.set_author(
+        name=user.display_name,
+        url=f"https://discordapp.com/users/{user.id}",
+        icon_url=user.display_avatar.url,
+    )
+    fmt = time.strftime("%B %d, %Y at %H:%M:%S", datetime.datetime.now().timetuple())
+    embed.set_footer(text=f"husky @ {fmt} ~ {prefix}help")
+    return embed
+
+
+def run_embed_benchmark(
+    factory: EmbedFactory, user: discord.abc.User, n: int = 10_000
+) -> str:
+    """Times `n` embeds built the old way against `n` from `factory`."""
+    paths = {
+        "legacy": lambda: legacy_embed(user, factory.prefix),
+        "factory": lambda: factory.build("title", "description", author=user),
+    }
+    lines = [f"{'path':<10}{'per embed':>12}{'embeds/s':>12}"]
+    for name, build in paths.items():
+        build()  # warm up caches
+        start = perf_counter()
+        for _ in range(n):
+            build()
+        seconds = perf_counter() - start
+        lines.append(f"{name:<10}{seconds / n * 1e6:>10.2f}us{n / seconds:>12.0f}")
+    return "\n".join(lines)
+
+
+@dataclass
+class LegacyTask:
+    """`Task` as it was before it became a record class, for comparison."""
+
+    task_id: int
+    user_id: int
+    task: str
+    date: Optional[datetime.date]
+    time: Optional[datetime.time]
+    remind_type: int
+    datetime_created: datetime.datetime
+
+
+async def _legacy_user_tasks(todo: TODO, user_id: int) -> list[LegacyTask]:
+    """`TODO.get_user_tasks` as it was before `Query`, for comparison."""
+    rows = await todo.pool.fetch("SELECT * FROM todo WHERE user_id = $1", user_id)
+    return [autowrap(LegacyTask, t) for t in rows]
+
+
+async def _legacy_overdue_tasks(todo: TODO, threshold_sec: int) -> list[LegacyTask]:
+    rows = await todo.pool.fetch(
+        "SELECT * FROM todo WHERE time < CURRENT_TIME - $1::INTERVAL AND date <= CURRENT_DATE",
+        datetime.timedelta(seconds=threshold_sec),
+    )
+    return [autowrap(LegacyTask, t) for t in rows]
+
+
+def _row_bytes(row: Any) -> int:
+    """Size of the row object itself. The column values are the same either way."""
+    return sys.getsizeof(row) + (
+        sys.getsizeof(vars(row)) if hasattr(row, "__dict__") else 0
+    )
+
+
+async def run_db_benchmark(todo: TODO, user_id: int, n: int = 200) -> str:
+    """Times `n` calls of `get_user_tasks` and `get_overdue_tasks` through the old
+    `SELECT *` + `autowrap` path and through `Query`, and compares the size of the
+    rows each returns. Reads only."""
+    paths = {
+        ("user tasks", "legacy"): lambda: _legacy_user_tasks(todo, user_id),
+        ("user tasks", "query"): lambda: todo.get_user_tasks(user_id),
+        ("overdue", "legacy"): lambda: _legacy_overdue_tasks(todo, 5),
+        ("overdue", "query"): lambda: todo.get_overdue_tasks(5),
+    }
+    lines = [
+        f"{'query':<12}{'path':<8}{'rows':>6}{'per call':>12}{'per row':>12}{'row size':>10}"
+    ]
+    for (query, path), call in paths.items():
+        rows = await call()  # also warms up statement caches
+        start = perf_counter()
+        for _ in range(n):
+            await call()
+        per_call = (perf_counter() - start) / n
+        if rows:
+            per_row = f"{per_call / len(rows) * 1e6:>10.2f}us"
+            size = f"{_row_bytes(rows[0]):>9}B"
+        else:
+            per_row, size = f"{'-':>12}", f"{'-':>10}"
+        lines.append(
+            f"{query:<12}{path:<8}{len(rows):>6}{per_call * 1000:>10.3f}ms{per_row}{size}"
+        )
+    return "\n".join(lines)
@@ -1,8 +1,7 @@
-import datetime
-import json
-import time
+import asyncio
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Generator,
     Mapping,
@@ -14,7 +13,7 @@ from typing import (
 )
 import typing
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.app_commands import CommandTree
 from discord.ext.commands.cog import Cog
 from discord.ext.commands.core import Command
@@ -23,37 +22,146 @@ from discord.message import Message
 from .utils.errors import AmbiguousCommandName
 
 from .utils.types import LoadedFile
+from .utils.lookup import CommandIndex
+from .utils.config import client_options
+from .utils.memory import CacheSize, estimate
+from .utils.views import ViewRegistry
+from .utils.sync import SyncDiff, SyncState, hashes
+from .utils.startup import StartupPhases
+from .utils.gate import MessageGate
+from .utils.tracing import Trace, TraceRecorder, current_trace, span
+from .utils.lazy import ExtensionManifest, build_stub_cog, scan_extension
+from .utils.reloader import Reloader, ReloadResult
+from .utils.journal import CommandJournal
+from .utils.stalls import StallMonitor
+from .utils.http import HuskyHTTP
+from .utils.embeds import DEFAULT_COLOR, EmbedFactory
 from . import logging_setup
 import logging
-from glob import glob
+from pathlib import Path
+from time import perf_counter
 import asyncpg
 import aiohttp
 import importlib
+import sys
 
-from .database.database import HuskyPool, HuskyWrapper, Users, TODO
+from .database.database import HuskyPool, HuskyWrapper, Users, TODO, Journal
+from .database.migrations import migrate
 
 
 class Husky(commands.Bot):
-    def __init__(self):
+    """The bot, on a single gateway connection. See `ShardedHusky` for more."""
+
+    def __init__(
+        self,
+        *,
+        env: Optional[dict[str, Any]] = None,
+        shard_ids: Optional[list[int]] = None,
+        shard_count: Optional[int] = None,
+        primary: bool = True,
+    ):
         self.prefix = "hk "
         super().__init__(
             command_prefix=self.prefix,
             help_command=None,
             tree_cls=HuskyTree,
-            intents=discord.Intents.all(),
+            shard_ids=shard_ids,
+            shard_count=shard_count,
+            **client_options(env or {}),
         )
 
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession(
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0"
-            }
+        self.env = env or {}
+        """The parsed contents of `env.json`."""
+        self.primary = primary
+        """Whether this process runs the process-wide tasks (e.g. the reminder loop). Only one process should."""
+
+        self.embeds = EmbedFactory(self.prefix)
+        """Builds `HuskyContext.embed`/`HuskyCog.embed`, caching footers and author blocks."""
+        self.web_client = HuskyHTTP(**self.env.get("http", {}))
+        """Shared HTTP client for outside requests. `Client.http` is discord.py's own."""
+        self.command_index = CommandIndex()
+        """Suffix/alias lookup used by `get_context` when a message doesn't match a command exactly."""
+        self.gate = MessageGate(self.prefix)
+        """Drops messages that can't be commands before `get_context` is called."""
+        self.traces = TraceRecorder()
+        """Per-command span latencies, filled by `HuskyContext.span`."""
+        self.lazy_extensions: dict[str, ExtensionManifest] = {}
+        """Extensions registered as command stubs that haven't been imported yet."""
+        self.extension_timings: dict[str, tuple[str, float]] = {}
+        """Extension -> (how it was loaded, seconds it took). Lazy extensions are listed twice: once for the stub, once for the real import."""
+        self._lazy_lock = asyncio.Lock()
+        self.reloader = Reloader()
+        """Tracks which extension/utils sources changed since they were loaded."""
+        journal = self.env.get("journal", {})
+        self.journal = CommandJournal(
+            per_user=journal.get("per_user", 50),
+            persist=journal.get("persist", False),
+        )
+        """Recent commands per user, used to replay them without fetching history."""
+        stalls = self.env.get("stalls", {})
+        self.stall_monitor = StallMonitor(
+            threshold=stalls.get("threshold_ms", 100) / 1000
         )
+        """Records where the event loop was blocked for longer than the threshold."""
+        self.stall_task: Optional[asyncio.Task] = None
+        self.views = ViewRegistry(**self.env.get("views", {}))
+        """Every attached `HuskyView`: runs their timeouts and caps how many are open."""
+        self.view_task: Optional[asyncio.Task] = None
+        self.sync_task: Optional[asyncio.Task] = None
+        self.startup = StartupPhases()
+        """Timings of `setup_hook`'s phases, logged once the gateway is ready."""
+
+    async def process_commands(self, message: discord.Message) -> None:
+        if not self.gate.admit(message):
+            return
+        try:
+            await super().process_commands(message)
+        except AmbiguousCommandName as e:
+            # raised from get_context, so there is no context to hand to the error handler yet
+            ctx = await super().get_context(message, cls=HuskyContext)
+            self.dispatch("command_error", ctx, e)
+
+    async def on_command_error(self, ctx: "HuskyContext", error: Exception) -> None:
+        if isinstance(error, AmbiguousCommandName):
+            ranked = self.command_index.rank(error.name, error.found_commands)
+            await self.send_suggestions(ctx, error.name, ranked)
+        elif isinstance(error, commands.CommandNotFound) and ctx.invoked_with:
+            content = ctx.message.content[len(ctx.prefix or "") :].split()
+            suggestions: dict[HuskyCommand, float] = {}
+            # the command may be one or two words long, so try both
+            for name in (" ".join(content[:2]), ctx.invoked_with):
+                for command, score in self.command_index.suggest(name):
+                    suggestions[command] = max(score, suggestions.get(command, 0))
+            if suggestions:
+                ranked = sorted(suggestions, key=suggestions.get, reverse=True)
+                await self.send_suggestions(ctx, ctx.invoked_with, ranked[:5])
+        else:
+            await super().on_command_error(ctx, error)
+
+    async def send_suggestions(
+        self, ctx: "HuskyContext", name: str, suggestions: list["HuskyCommand"]
+    ) -> None:
+        embed = ctx.embed(
+            title=f"Command `{name}` not found",
+            description="Did you mean:\n"
+            + "\n".join(f"- `{self.prefix}{c.qualified_name}`" for c in suggestions),
+        )
+        await ctx.send(embed=embed)
 
     async def get_context(
         self,
         origin: Union[discord.Message, discord.Interaction],
         *,
         cls: Optional[Type[commands.Context["Husky"]]] = None,
+    ) -> "HuskyContext":
+        ctx = await self.resolve_context(origin)
+        if ctx.command is not None and ctx.command.extras.get("trace", True):
+            ctx.trace = Trace(self.traces, ctx)
+            current_trace.set(ctx.trace)
+        return ctx
+
+    async def resolve_context(
+        self, origin: Union[discord.Message, discord.Interaction]
     ) -> "HuskyContext":
         ctx = await super().get_context(origin, cls=HuskyContext)
         if ctx.command is None and ctx.prefix is not None:
@@ -69,13 +177,7 @@ class Husky(commands.Bot):
                     command_name_parts = command_content.split(" ")[0:i]
                     command_name = " ".join(command_name_parts).strip()
 
-                    found_commands = list(
-                        filter(
-                            lambda c: c.qualified_name.endswith(command_name)
-                            or any(alias == command_name for alias in c.aliases),
-                            self.walk_commands(),
-                        )
-                    )
+                    found_commands = self.command_index.resolve(command_name)
                     if len(found_commands) == 0:
                         continue
                     elif len(found_commands) == 1:
@@ -90,71 +192,255 @@ class Husky(commands.Bot):
                         #     command, *command_name_parts[i:].extend(ctx.message.attachments)
                         # )
                     else:
-                        raise AmbiguousCommandName(found_commands)
+                        raise AmbiguousCommandName(found_commands, command_name)
             except AmbiguousCommandName as e:
                 raise e
             except Exception as e:
                 return ctx
         return ctx
 
+    async def on_command_completion(self, ctx: "HuskyContext") -> None:
+        if ctx.trace is not None:
+            ctx.trace.finish()
+        self.journal.record(ctx)
+
     async def setup_hook(self) -> None:
         logging_setup.begin()
         logging.info(f"{self.__class__.__name__} starting...")
 
-        await self.reload_extensions()
-        await self.connect_psql()
-        await self.start_tasks()
+        self.startup.mark("login")
 
-        logging.info(f"{self.__class__.__name__} ready")
+        async def extensions() -> None:
+            await self.reload_extensions()
+            logging.info(self.format_extension_timings())
 
-    async def reload_extensions(self) -> tuple[list[LoadedFile], list[LoadedFile]]:
-        format: Callable[[str], str] = (
-            lambda path: path.replace("\\", ".").removesuffix(".py").strip(".")
-        )
+        # importing extensions and opening the pool don't depend on each other
+        self.startup.add("extensions", extensions)
+        self.startup.add("database", self.connect_psql)
+        self.startup.add("schema", self.make_tables, after=["database"])
+        self.startup.add("users", lambda: self.db_users.warm(), after=["schema"])
+        self.startup.add("tasks", self.start_tasks, after=["extensions", "schema"])
+        await self.startup.run()
 
-        loaded_ext = []
-        loaded_util = []
-        for ext_path in glob(".\\src\\ext\\*.py", recursive=True):
-            path = format(ext_path)
-            try:
-                await self.load_extension(path)
-            except commands.ExtensionAlreadyLoaded:
-                await self.reload_extension(path)
+        logging.info(f"{self.__class__.__name__} set up, connecting")
 
-            loaded_ext.append(LoadedFile(path, path[path.rfind(".") + 1 :]))
+    async def on_ready(self) -> None:
+        if not any(t.name == "ready" for t in self.startup.timings):
+            self.startup.mark("ready")
+            logging.info(self.startup.timeline())
+            logging.info(f"{self.__class__.__name__} ready")
 
-        for ext_path in glob(".\\src\\utils\\*.py", recursive=True):
-            path = format(ext_path)
-            try:
-                module = importlib.import_module(path)
-                importlib.reload(module)
-            except ImportError:
-                continue
+    async def close(self) -> None:
+        await super().close()
+        await self.web_client.close()
 
-            loaded_util.append(LoadedFile(path, path[path.rfind(".") + 1 :]))
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self.web_client.session
+
+    async def reload_extensions(self, changed_only: bool = False) -> ReloadResult:
+        """(Re)loads the modules in `src/ext` and `src/utils` - all of them, or only those
+        whose source changed since they were last loaded - together with every module
+        that depends on them, dependencies first."""
+        infos = await asyncio.to_thread(self.reloader.scan)
+        pinned = await asyncio.to_thread(self.reloader.pinned, infos)
+        if not self.reloader.digests:
+            # the core imported these itself, so they are already up to date
+            self.reloader.commit(infos, pinned)
+
+        changed = self.reloader.changed(infos)
+        targets = (changed if changed_only else set(infos)) - pinned
+        lazy = set(self.env.get("extensions", {}).get("lazy", []))
 
-        return loaded_ext, loaded_util
+        loaded_ext = []
+        loaded_util = []
+        for name in self.reloader.affected(infos, targets):
+            info = infos[name]
+            start = perf_counter()
+            if info.is_extension:
+                if info.file.filename in lazy and name not in self.extensions:
+                    if name in self.lazy_extensions:
+                        await self.remove_cog(self.lazy_extensions.pop(name).cog)
+                    await self.add_lazy_extension(name, info.path)
+                    self.extension_timings[name] = ("stub", perf_counter() - start)
+                else:
+                    try:
+                        await self.load_extension(name)
+                    except commands.ExtensionAlreadyLoaded:
+                        await self.reload_extension(name)
+                    self.extension_timings[name] = ("import", perf_counter() - start)
+                loaded_ext.append(info.file)
+            else:
+                try:
+                    if name in sys.modules:
+                        importlib.reload(sys.modules[name])
+                    else:
+                        importlib.import_module(name)
+                except ImportError:
+                    continue
+                loaded_util.append(info.file)
+
+            self.reloader.commit(infos, [name])
+            # let the gateway and other commands run between modules
+            await asyncio.sleep(0)
+
+        self.index_commands()
+        skipped = [infos[name].file for name in sorted(changed & pinned)]
+        if skipped:
+            logging.warning(
+                f"not reloading {', '.join(f.path for f in skipped)}: imported by the core, restart to apply"
+            )
+        return ReloadResult(loaded_ext, loaded_util, skipped)
+
+    async def mark_loaded(self, *names: str) -> None:
+        """Records the current source of the modules `names` as loaded, for modules
+        (re)loaded outside `reload_extensions`, so its next changed-only run doesn't
+        reload them again."""
+        infos = await asyncio.to_thread(self.reloader.scan)
+        self.reloader.commit(infos, [name for name in names if name in infos])
+
+    def index_commands(self) -> None:
+        """Rebuilds the lookups derived from the command set. Call after commands are
+        added or removed."""
+        commands = list(self.walk_commands())
+        self.command_index.rebuild(commands)
+        self.stall_monitor.index(commands)
+
+    async def add_lazy_extension(self, extension: str, file: Path) -> None:
+        """Registers prefix command stubs for `extension` without importing it. The
+        first invocation of any stub imports the extension and re-runs the message."""
+        manifest = scan_extension(file, extension)
+        await self.add_cog(self.build_stub_cog(manifest))
+        self.lazy_extensions[extension] = manifest
+
+    def build_stub_cog(self, manifest: ExtensionManifest) -> "HuskyCog":
+        async def materialize(cog: HuskyCog, ctx: HuskyContext) -> None:
+            await self.load_lazy_extension(manifest.extension)
+            await self.process_commands(ctx.message)
+
+        return build_stub_cog(manifest, HuskyCog, materialize)(self)
+
+    async def load_lazy_extension(self, extension: str) -> None:
+        async with self._lazy_lock:
+            manifest = self.lazy_extensions.pop(extension, None)
+            if manifest is None:
+                return  # already imported
+
+            await self.remove_cog(manifest.cog)
+            start = perf_counter()
+            try:
+                await self.load_extension(extension)
+            except Exception:
+                # put the stubs back so the next invocation can retry
+                await self.add_cog(self.build_stub_cog(manifest))
+                self.lazy_extensions[extension] = manifest
+                raise
+            self.index_commands()
+            seconds = perf_counter() - start
+            self.extension_timings[extension] = ("lazy import", seconds)
+            logging.info(f"lazily imported {extension} in {seconds * 1000:.1f}ms")
+
+    async def load_lazy_app_command(self, name: str) -> None:
+        """Imports the lazy extension providing the top-level application command `name`, if any."""
+        for extension, manifest in list(self.lazy_extensions.items()):
+            if any(c.parent is None and c.name == name for c in manifest.commands):
+                await self.load_lazy_extension(extension)
+                return
+
+    async def sync_commands(
+        self, guild: Optional[discord.abc.Snowflake] = None, *, force: bool = False
+    ) -> Optional[SyncDiff]:
+        """Syncs the application commands if they changed since the last sync. The
+        commands of lazy extensions are compared by the hash of the extension's
+        source, so they are only imported when something has to be synced."""
+
+        async def import_lazy() -> None:
+            for extension in list(self.lazy_extensions):
+                await self.load_lazy_extension(extension)
+
+        sources = {} if guild is not None else await self.lazy_app_commands()
+        diff = await self.tree.sync_changed(
+            guild=guild, force=force, sources=sources, prepare=import_lazy
+        )
+        if diff is not None:
+            logging.info(f"synced application commands: {diff.describe()}")
+        return diff
+
+    async def lazy_app_commands(self) -> dict[str, str]:
+        """Top-level application command -> source hash of the lazy extension that
+        defines it, whether or not the extension has been imported yet."""
+        infos = await asyncio.to_thread(self.reloader.scan)
+        found = {}
+        for filename in self.env.get("extensions", {}).get("lazy", []):
+            info = infos.get(f"src.ext.{filename}")
+            if info is None:
+                continue
+            manifest = await asyncio.to_thread(scan_extension, info.path, info.name)
+            for stub in manifest.commands:
+                if stub.is_hybrid and stub.parent is None:
+                    found[stub.name] = info.digest
+        return found
+
+    def format_extension_timings(self) -> str:
+        lines = ["extension timings:"]
+        for extension, (mode, seconds) in sorted(
+            self.extension_timings.items(), key=lambda kv: kv[1][1], reverse=True
+        ):
+            lines.append(f"  {extension:<24}{mode:<14}{seconds * 1000:>8.1f}ms")
+        return "\n".join(lines)
 
     async def connect_psql(self) -> None:
-        env = open("env.json", "r")
-        dir = json.load(env)["psql"]
+        dir = self.env["psql"]
         pool = await asyncpg.create_pool(
             dsn=f"postgresql://{dir['user']}:{dir['password']}@{dir['host']}:{dir['port']}/{dir['database']}"
         )
         # self.pool = HuskyPool.from_apg_pool(pool)
         self.pool = pool
-        await self.instantiate_database_wrappers()
+        self.instantiate_database_wrappers()
 
-    async def instantiate_database_wrappers(self) -> None:
+    def instantiate_database_wrappers(self) -> None:
         self.db_users: Users = Users(self.pool)
-        await self.db_users.make_table()
         self.db_todo: TODO = TODO(self.pool)
-        await self.db_todo.make_table()
-    
+        self.db_journal: Journal = Journal(self.pool)
+
+    async def make_tables(self) -> None:
+        """Applies pending schema migrations."""
+        await migrate(self.pool)
+
     async def start_tasks(self) -> None:
-        await self.load_extension("src.watchdog")
+        self.view_task = asyncio.create_task(self.views.run())
+        if self.primary and self.env.get("commands", {}).get("sync_on_start", False):
+            self.sync_task = asyncio.create_task(self.sync_commands())
+        if self.env.get("stalls", {}).get("enabled", True):
+            self.stall_task = asyncio.create_task(self.stall_monitor.run())
+        if self.primary:
+            await self.load_extension("src.watchdog")
+        if self.journal.persist:
+            self.flush_journal.change_interval(
+                seconds=self.env["journal"].get("flush_seconds", 10)
+            )
+            self.flush_journal.start()
         
 
+    @tasks.loop(seconds=10)
+    async def flush_journal(self) -> None:
+        entries = self.journal.drain()
+        if entries:
+            try:
+                await self.db_journal.add_entries(entries)
+            except Exception:
+                logging.exception(f"dropped {len(entries)} journal entries")
+
+    def cache_report(self) -> list[CacheSize]:
+        members = [m for g in self.guilds for m in g.members]
+        return [
+            estimate("users", list(self.users)),
+            estimate("members", members),
+            estimate("messages", list(self.cached_messages)),
+            self.views.report(),
+            estimate("guilds", list(self.guilds)),
+        ]
+
     # overrides for inherited methods
     def get_command(self, name: str) -> "HuskyCommand":
         return super().get_command(name)
@@ -177,15 +463,76 @@ class Husky(commands.Bot):
         return super().remove_command(name)
 
     async def add_cog(self, cog: "HuskyCog") -> None:
-        return await super().add_cog(cog)
+        await super().add_cog(cog)
+        self.command_index.add_all(cog.walk_commands())
 
     async def remove_cog(self, name: str) -> Optional["HuskyCog"]:
-        return await super().remove_cog(name)
+        cog = await super().remove_cog(name)
+        if cog is not None:
+            self.command_index.remove_all(cog.walk_commands())
+        return cog
+
+
+class ShardedHusky(Husky, commands.AutoShardedBot):
+    """`Husky` on several shards: `shard_count` of them, or Discord's recommended
+    count if that is None. With `shard_ids`, only those shards are connected, so
+    the rest can run in other processes (see `launcher.Supervisor`)."""
 
 
 class HuskyTree(CommandTree):
     def __init__(self, client: discord.Client):
         super().__init__(client, fallback_to_global=True)
+        self.sync_state = SyncState()
+        """Hashes of the payload as last synced, shared by every process through a file."""
+
+    async def payload(
+        self, guild: Optional[discord.abc.Snowflake] = None
+    ) -> list[dict[str, Any]]:
+        """The commands as `sync` would send them."""
+        commands = self.get_commands(guild=guild)
+        if self.translator:
+            return [
+                await c.get_translated_payload(self, self.translator) for c in commands
+            ]
+        return [c.to_dict(self) for c in commands]
+
+    async def sync_changed(
+        self,
+        *,
+        guild: Optional[discord.abc.Snowflake] = None,
+        force: bool = False,
+        sources: dict[str, str] = {},
+        prepare: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> Optional[SyncDiff]:
+        """`sync`, skipped when the payload is the one last synced. Returns what
+        changed, or None if nothing was sent.
+
+        `sources` maps the keys of commands that may not be registered yet to a
+        hash standing in for their payload (the source of the extension defining
+        them). `prepare` is awaited before syncing, and should register them."""
+        new = hashes(await self.payload(guild)) | sources
+        key = SyncState.key(self.client.application_id, guild and guild.id)
+        diff = self.sync_state.diff(key, new)
+        if diff is None:
+            # never synced from here, so Discord's copy is unknown
+            diff = SyncDiff(sorted(new), [], [])
+        elif not diff and not force:
+            return None
+        if prepare is not None:
+            await prepare()
+        await self.sync(guild=guild)
+        self.sync_state.commit(key, new)
+        return diff
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # lazily loaded cogs only have prefix stubs, so import them before the tree
+        # looks up the application command (or its autocomplete)
+        if interaction.type in (
+            discord.InteractionType.application_command,
+            discord.InteractionType.autocomplete,
+        ):
+            await self.client.load_lazy_app_command(interaction.data.get("name", ""))
+        return True
 
 
 class HuskyContext(commands.Context):
@@ -193,9 +540,17 @@ class HuskyContext(commands.Context):
         self._guild: discord.Guild = kwargs.get("guild", kwargs["message"].guild)
         self._message: discord.Message = kwargs["message"]
         self._bot: Husky = kwargs["bot"]
+        self.trace: Trace | None = None
+        """Set by `Husky.get_context` once the invoked command is known."""
 
         super().__init__(**kwargs)
 
+    def span(self, name: str):
+        """Times the enclosed block as a named sub-span of this invocation."""
+        if self.trace is None:
+            return span(name)
+        return self.trace.span(name)
+
     @property
     def guild(self) -> discord.Guild:
         return self._guild
@@ -220,27 +575,12 @@ class HuskyContext(commands.Context):
         self,
         title: Optional[str] = None,
         description: Optional[str] = None,
-        color: discord.Color = discord.Color.dark_teal(),
+        color: discord.Color = DEFAULT_COLOR,
         **kwargs,
     ):
-        embed = discord.Embed(
-            title=title, description=description, color=color, **kwargs
-        )
-        embed.timestamp = datetime.datetime.now()
-        embed.set_author(
-            name=self.author.display_name,
-            url=f"https://discordapp.com/users/{self.author.id}",
-            icon_url=self.author.display_avatar.url,
-        )
-        # formatted time Month Day, Year at Hour:Minute:Second
-        fmt = time.strftime(
-            "%B %d, %Y at %H:%M:%S", datetime.datetime.now().timetuple()
-        )
-
-        embed.set_footer(
-            text=f"husky @ {fmt} ~ {self.prefix}help",
+        return self.bot.embeds.build(
+            title, description, color, author=self.author, **kwargs
         )
-        return embed
 
 
 class HuskyCog(commands.Cog):
@@ -276,30 +616,12 @@ class HuskyCog(commands.Cog):
         self,
         title: Optional[str] = None,
         description: Optional[str] = None,
-        color: discord.Color = discord.Color.dark_teal(),
+        color: discord.Color = DEFAULT_COLOR,
+        author_id: Optional[int] = None,
         **kwargs,
     ):
-        embed = discord.Embed(
-            title=title, description=description, color=color, **kwargs
-        )
-        embed.timestamp = datetime.datetime.now()
-        author_id = kwargs.get("author_id", None)
-        if author_id is not None:
-            author = self.bot.get_user(author_id)
-            embed.set_author(
-                name=author.display_name,
-                url=f"https://discordapp.com/users/{author.id}",
-                icon_url=author.display_avatar.url,
-            )
-        # formatted time Month Day, Year at Hour:Minute:Second
-        fmt = time.strftime(
-            "%B %d, %Y at %H:%M:%S", datetime.datetime.now().timetuple()
-        )
-
-        embed.set_footer(
-            text=f"husky @ {fmt} ~ {self.prefix}help",
-        )
-        return embed
+        author = self.bot.get_user(author_id) if author_id is not None else None
+        return self.bot.embeds.build(title, description, color, author=author, **kwargs)
 
 
 class _HuskyMessage(discord.Message):
@@ -1,6 +1,20 @@
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
 import logging
-from typing import Any, Callable, Generic, Set, TypeVar
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Generic,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
 import discord
 from discord.ext import commands
 
@@ -9,6 +23,8 @@ from .cls_bot import HuskyContext
 from .utils.types import Indicies
 
 from .utils.errors import InternalError
+from .utils.edits import EditScheduler
+from .utils.views import ViewRegistry
 
 
 T = TypeVar("T")
@@ -29,19 +45,85 @@ class HuskyViewOptions:
 
 
 class HuskyView(discord.ui.View):
+    edits: ClassVar[EditScheduler] = EditScheduler()
+    """Shared by every view, so edits to a message are coalesced whichever view makes them."""
+
     def __init__(self, *, options: HuskyViewOptions = HuskyViewOptions.default()):
-        super().__init__(timeout=options.timeout)
+        # timeouts are run by `Husky.views` once the view is attached, rather than
+        # by a task per view
+        super().__init__(timeout=None)
 
         self.opts = options
         self.message: discord.Message | None = None
+        self.registry: Optional[ViewRegistry] = None
+
+    def attach(self, ctx: HuskyContext, message: discord.Message) -> None:
+        """Records the message this view was sent with and hands the view to
+        `Husky.views`, which times it out and may evict it if `ctx.author` (or
+        everyone) has too many views open. Call right after sending."""
+        self.message = message
+        self.registry = ctx.bot.views
+        self.registry.add(self, owner_id=ctx.author.id, timeout=self.opts.timeout)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        return self.opts.func_allow_inter(interaction)
+        allowed = self.opts.func_allow_inter(interaction)
+        if allowed and self.registry is not None:
+            self.registry.touch(self)
+        return allowed
+
+    def stop(self) -> None:
+        if self.registry is not None:
+            self.registry.discard(self)
+        super().stop()
+
+    async def replace(
+        self, itx: discord.Interaction, ctx: HuskyContext, view: "HuskyView", **kwargs
+    ) -> None:
+        """Swaps this view for `view` on the same message (along with `kwargs`, as
+        `update`). This view is stopped and `view` attached in its place, so
+        navigating doesn't leave views behind in the registry or discord.py."""
+        HuskyView.stop(self)
+        view.attach(ctx, self.message)
+        await self.update(itx, view=view, **kwargs)
+
+    def expire(self) -> None:
+        HuskyView.stop(self)  # subclasses may shadow `stop` with a button
+        asyncio.create_task(self.on_timeout(), name=f"husky-view-timeout-{self.id}")
+
+    def evict(self) -> None:
+        for child in self.children:
+            if isinstance(child, (discord.ui.Button, discord.ui.Select)):
+                child.disabled = True
+        if self.message is not None:
+            self.edits.schedule(self.message.id, self.message.edit, view=self)
+        HuskyView.stop(self)
 
     async def on_timeout(self) -> None:
         if self.opts.delete_after_timeout and self.message is not None:
+            self.edits.cancel(self.message.id)
             await self.message.delete()
 
+    async def update(self, itx: Optional[discord.Interaction] = None, **kwargs) -> None:
+        """Edits the message this view is attached to with `kwargs` (as `Message.edit`).
+        `itx` is acknowledged immediately, but the edit itself goes through `edits`,
+        so rapid interactions only send the latest state. Use this rather than
+        `itx.response.edit_message` so queued edits can't land out of order."""
+        if itx is None:
+            if self.message is None:
+                raise InternalError(f"{self.__class__.__name__}.message is None")
+            self.edits.schedule(self.message.id, self.message.edit, **kwargs)
+            return
+
+        await edit_interaction_message(itx, **kwargs)
+
+
+async def edit_interaction_message(itx: discord.Interaction, **kwargs) -> None:
+    """`HuskyView.update` for components that don't belong to a `HuskyView`: defers
+    `itx` and queues an edit of its message through `HuskyView.edits`."""
+    if not itx.response.is_done():
+        await itx.response.defer()
+    HuskyView.edits.schedule(itx.message.id, itx.edit_original_response, **kwargs)
+
 
 class HuskyPaginator(HuskyView, Generic[T]):
     def __init__(
@@ -52,6 +134,7 @@ class HuskyPaginator(HuskyView, Generic[T]):
         *,
         extras: dict[str, Any] = {},
         options: HuskyViewOptions = HuskyViewOptions.default(),
+        cached_pages: int = 16,
     ):
         super().__init__(options=options)
 
@@ -70,6 +153,13 @@ class HuskyPaginator(HuskyView, Generic[T]):
         if len(self.items) % self.items_per_page != 0:
             self.n_pages += 1  # add one if there's any remaining
 
+        self.cached_pages = cached_pages
+        """How many rendered pages to keep. 0 disables the cache."""
+        self.rendered: OrderedDict[int, tuple[discord.Embed, str]] = OrderedDict()
+        """Page -> output of `update_embed`/`update_content`, least recently shown first."""
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     @discord.ui.button(
         emoji="\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}",
         style=discord.ButtonStyle.blurple,
@@ -115,8 +205,13 @@ class HuskyPaginator(HuskyView, Generic[T]):
         self.page = self.n_pages - 1
         await self.update_view(inter, button)
 
+    @property
+    def page_label(self) -> str:
+        """`current/total`, for use in `update_embed`."""
+        return f"{self.page + 1}/{self.n_pages}"
+
     async def start(self, message: discord.Message) -> None:
-        self.message = message
+        self.attach(self.ctx, message)
         await self.update_view()
 
     async def update_view(
@@ -132,10 +227,8 @@ class HuskyPaginator(HuskyView, Generic[T]):
                 for child in self.children:
                     if isinstance(child, (discord.ui.Button, discord.ui.Select)):
                         child.disabled = True
-                if inter is not None:
-                    await inter.response.defer()
                 super().stop()
-                await self.message.edit(view=self)
+                await self.update(inter, view=self)
                 return
 
             for child in self.children:
@@ -166,12 +259,41 @@ class HuskyPaginator(HuskyView, Generic[T]):
             start=self.page * self.items_per_page,
             end=min((self.page + 1) * self.items_per_page, len(self.items)),
         )
+        embed, content = await self.render(indicies, current_content)
+
+        if inter is None:
+            # first render, nothing to coalesce with
+            await self.message.edit(content=content, embed=embed, view=self)
+        else:
+            await self.update(inter, content=content, embed=embed, view=self)
+
+    async def render(
+        self, indicies: Indicies, current_content: list[T]
+    ) -> tuple[discord.Embed, str]:
+        """`update_embed` and `update_content` for the current page, from `rendered`
+        if the page was shown before."""
+        cached = self.rendered.get(self.page)
+        if cached is not None:
+            self.cache_hits += 1
+            self.rendered.move_to_end(self.page)
+            return cached
+
+        self.cache_misses += 1
         embed = await self.update_embed(indicies, current_content)
         content = await self.update_content(indicies, current_content)
-
-        await self.message.edit(content=content, embed=embed, view=self)
-        if inter is not None:
-            await inter.response.defer()
+        if self.cached_pages > 0:
+            self.rendered[self.page] = (embed, content)
+            if len(self.rendered) > self.cached_pages:
+                self.rendered.popitem(last=False)
+        return embed, content
+
+    def invalidate(self, page: Optional[int] = None) -> None:
+        """Forgets the rendering of `page`, or of every page. Call after changing
+        `items` or anything else `update_embed`/`update_content` read."""
+        if page is None:
+            self.rendered.clear()
+        else:
+            self.rendered.pop(page, None)
 
     async def update_embed(
         self, indicies: Indicies, current_content: list[T]
@@ -184,6 +306,130 @@ class HuskyPaginator(HuskyView, Generic[T]):
         return ""
 
 
+PageFetcher = Callable[[int, int], Awaitable[list[T]]]
+"""`(offset, limit) -> items`. Returning fewer than `limit` items ends the source."""
+
+
+async def iterate_pages(fetch: PageFetcher[T], page_size: int) -> AsyncIterator[T]:
+    offset = 0
+    while True:
+        page = await fetch(offset, page_size)
+        for item in page:
+            yield item
+        if len(page) < page_size:
+            return
+        offset += len(page)
+
+
+class HuskyStreamPaginator(HuskyPaginator[T]):
+    """A `HuskyPaginator` over an async iterator or a `PageFetcher`, for sources
+    that are expensive to load in full. Items are pulled as pages are shown, the
+    next page is prefetched in the background, and the page count reads `?`
+    until the source runs out. `self.items` holds everything pulled so far."""
+
+    def __init__(
+        self,
+        ctx: HuskyContext,
+        source: Union[AsyncIterator[T], PageFetcher[T]],
+        items_per_page: int,
+        *,
+        extras: dict[str, Any] = {},
+        options: HuskyViewOptions = HuskyViewOptions.default(),
+        cached_pages: int = 16,
+    ):
+        super().__init__(
+            ctx,
+            [],
+            items_per_page,
+            extras=extras,
+            options=options,
+            cached_pages=cached_pages,
+        )
+        if callable(source):
+            source = iterate_pages(source, items_per_page)
+        self.source: AsyncIterator[T] = source
+        self.exhausted = False
+        """Whether every item of the source has been pulled."""
+        self._lock = asyncio.Lock()
+        self._prefetch: Optional[asyncio.Task] = None
+
+    @property
+    def page_label(self) -> str:
+        return f"{self.page + 1}/{self.n_pages if self.exhausted else '?'}"
+
+    async def fill(self, count: Optional[int] = None) -> None:
+        """Pulls items until there are at least `count` of them, or all of them."""
+        async with self._lock:
+            pulled = len(self.items)
+            while not self.exhausted and (count is None or len(self.items) < count):
+                try:
+                    self.items.append(await anext(self.source))
+                except StopAsyncIteration:
+                    self.exhausted = True
+            if len(self.items) != pulled:
+                # the page the first new item landed on was rendered short, if at
+                # all. pages before it keep their rendering: `update_header`
+                # refreshes the counts on them each time they are shown
+                self.invalidate(pulled // self.items_per_page)
+            self.n_pages = -(-len(self.items) // self.items_per_page)
+
+    async def render(
+        self, indicies: Indicies, current_content: list[T]
+    ) -> tuple[discord.Embed, str]:
+        embed, content = await super().render(indicies, current_content)
+        self.update_header(embed)
+        return embed, content
+
+    def update_header(self, embed: discord.Embed) -> None:
+        """Sets the parts of `embed` that depend on how much of the source has been
+        pulled, e.g. `page_label` or a result count. Called every time a page is
+        shown, cached or not. May be overridden by an inheriting class."""
+
+    async def update_view(
+        self,
+        inter: discord.Interaction | None = None,
+        button: discord.Button | None = None,
+    ) -> None:
+        if button is not None and button.custom_id == "stop":
+            if self._prefetch is not None:
+                self._prefetch.cancel()
+            await super().update_view(inter, button)
+            return
+
+        if inter is not None and not inter.response.is_done():
+            await inter.response.defer()  # fetching may outlast the ack window
+
+        if button is self.full_next:
+            await self.fill()
+            self.page = self.n_pages - 1
+        else:
+            # one item past the page tells us whether there is a next one
+            await self.fill((self.page + 1) * self.items_per_page + 1)
+            self.page = min(self.page, max(self.n_pages - 1, 0))
+        await super().update_view(inter, button)
+
+        if not self.exhausted and (self._prefetch is None or self._prefetch.done()):
+            self._prefetch = asyncio.create_task(
+                self.fill((self.page + 2) * self.items_per_page + 1)
+            )
+            self._prefetch.add_done_callback(self._prefetch_done)
+
+    @staticmethod
+    def _prefetch_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logging.error("paginator prefetch failed", exc_info=task.exception())
+
+    async def on_timeout(self) -> None:
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+        await super().on_timeout()
+
+    def evict(self) -> None:
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+        super().evict()
+
+
 class HuskyPanel(HuskyView):
     def __init__(
         self,
@@ -207,14 +453,216 @@ class HuskyPanel(HuskyView):
         for child in self.children:
             if isinstance(child, (discord.ui.Button, discord.ui.Select)):
                 child.disabled = True
-        await itx.response.edit_message(view=self)
+        await self.update(itx, view=self)
         super().stop()
 
 
 class HuskyModal(discord.ui.Modal):
-    def __init__(self, ctx: HuskyContext):
+    def __init__(
+        self, ctx: Optional[HuskyContext] = None, *, owner_id: Optional[int] = None
+    ):
         self.ctx = ctx
+        self.owner_id = owner_id if owner_id is not None else ctx.author.id
         super().__init__(timeout=360)
 
     async def interaction_check(self, itx: discord.Interaction) -> bool:
-        return itx.user == self.ctx.author
+        return itx.user.id == self.owner_id
+
+
+def disabled_view(message: discord.Message) -> discord.ui.View:
+    """The components of `message`, all disabled, for ending a persistent view."""
+    view = discord.ui.View.from_message(message, timeout=None)
+    for child in view.children:
+        child.disabled = True
+    view.stop()  # so the view store doesn't keep it
+    return view
+
+
+class OwnedItem:
+    """Mixin for `discord.ui.DynamicItem`s whose custom_id names the only user
+    allowed to use them."""
+
+    owner_id: int
+
+    async def interaction_check(self, itx: discord.Interaction) -> bool:
+        if itx.user.id == self.owner_id:
+            return True
+        await itx.response.send_message("This isn't yours to use.", ephemeral=True)
+        return False
+
+
+class PersistentPaginator(Generic[T]):
+    """A paginator that keeps no state in memory. Its buttons are `PageButton`s
+    whose custom_ids carry the paginator `kind`, the owner, the target page and a
+    short `key` (e.g. a filter), and every press re-fetches that page. An open
+    paginator costs nothing while idle and keeps working across restarts, as long
+    as the cog using it registers `PageButton` with `Husky.add_dynamic_items`.
+
+    Subclasses pass `kind=` in the class definition and implement `fetch` and
+    `render`, and `count` if the total is cheap to get."""
+
+    kinds: ClassVar[dict[str, type["PersistentPaginator"]]] = {}
+    kind: ClassVar[str]
+    items_per_page: ClassVar[int] = 5
+
+    def __init_subclass__(cls, kind: str, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.kind = kind
+        PersistentPaginator.kinds[kind] = cls
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        owner: discord.abc.User,
+        key: str = "",
+        page: int = 0,
+    ):
+        self.bot = bot
+        self.owner = owner
+        self.key = key
+        self.page = page
+        self.n_pages: Optional[int] = None
+        """Known once `build` has run, if `count` is implemented."""
+
+    async def fetch(self, offset: int, limit: int) -> list[T]:
+        raise NotImplementedError
+
+    async def count(self) -> Optional[int]:
+        """Total number of items, or None if unknown (the last-page button is then disabled)."""
+        return None
+
+    async def render(self, indicies: Indicies, items: list[T]) -> discord.Embed:
+        raise NotImplementedError
+
+    @property
+    def page_label(self) -> str:
+        return f"{self.page + 1}/{self.n_pages if self.n_pages is not None else '?'}"
+
+    async def build(
+        self, pressed: Optional[int] = None
+    ) -> Optional[tuple[discord.Embed, discord.ui.View]]:
+        """Fetches and renders `page`. Returns None if there is nothing to show."""
+        n = self.items_per_page
+        total = await self.count()
+        if total is not None:
+            self.n_pages = -(-total // n)
+            self.page = min(self.page, max(self.n_pages - 1, 0))
+        # one item past the page tells us whether there is a next one
+        items = await self.fetch(self.page * n, n + 1)
+        if not items and self.page == 0:
+            return None
+
+        has_next = len(items) > n
+        items = items[:n]
+        indicies = Indicies(start=self.page * n, end=self.page * n + len(items))
+        embed = await self.render(indicies, items)
+        return embed, self.view(has_next, pressed)
+
+    def view(self, has_next: bool, pressed: Optional[int] = None) -> discord.ui.View:
+        last = self.n_pages - 1 if self.n_pages is not None else None
+        targets = [0, max(self.page - 1, 0), self.page, self.page + 1, last]
+        enabled = [
+            self.page > 0,
+            self.page > 0,
+            True,
+            has_next,
+            has_next and last is not None,
+        ]
+        view = discord.ui.View(timeout=None)
+        for slot, (target, on) in enumerate(zip(targets, enabled)):
+            view.add_item(
+                PageButton(
+                    self.kind,
+                    self.owner.id,
+                    slot,
+                    target if target is not None else self.page,
+                    self.key,
+                    disabled=not on,
+                    pressed=slot == pressed,
+                )
+            )
+        return view
+
+
+PAGE_BUTTONS = (
+    "\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}",
+    "\N{BLACK LEFT-POINTING TRIANGLE}",
+    "\N{CROSS MARK}",
+    "\N{BLACK RIGHT-POINTING TRIANGLE}",
+    "\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}",
+)
+STOP_SLOT = 2
+
+
+class PageButton(
+    OwnedItem,
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"hk:page:(?P<kind>\w+):(?P<owner>\d+):(?P<slot>\d):(?P<target>\d+):(?P<key>.*)",
+):
+    def __init__(
+        self,
+        kind: str,
+        owner_id: int,
+        slot: int,
+        target: int,
+        key: str = "",
+        *,
+        disabled: bool = False,
+        pressed: bool = False,
+    ):
+        if slot == STOP_SLOT:
+            style = discord.ButtonStyle.danger
+        elif pressed:
+            style = discord.ButtonStyle.green
+        else:
+            style = discord.ButtonStyle.blurple
+        super().__init__(
+            discord.ui.Button(
+                emoji=PAGE_BUTTONS[slot],
+                style=style,
+                disabled=disabled,
+                custom_id=f"hk:page:{kind}:{owner_id}:{slot}:{target}:{key}",
+                row=0,
+            )
+        )
+        self.kind = kind
+        self.owner_id = owner_id
+        self.slot = slot
+        self.target = target
+        self.key = key
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        itx: discord.Interaction,
+        item: discord.ui.Button,
+        match: re.Match[str],
+    ) -> "PageButton":
+        return cls(
+            match["kind"],
+            int(match["owner"]),
+            int(match["slot"]),
+            int(match["target"]),
+            match["key"],
+        )
+
+    async def callback(self, itx: discord.Interaction) -> None:
+        if self.slot == STOP_SLOT:
+            await edit_interaction_message(itx, view=disabled_view(itx.message))
+            return
+
+        paginator_cls = PersistentPaginator.kinds.get(self.kind)
+        if paginator_cls is None:
+            await itx.response.send_message(
+                "This menu is no longer available.", ephemeral=True
+            )
+            return
+
+        await itx.response.defer()
+        paginator = paginator_cls(itx.client, itx.user, self.key, self.target)
+        built = await paginator.build(pressed=self.slot)
+        if built is None:
+            await edit_interaction_message(itx, view=None)
+            return
+        embed, view = built
+        await edit_interaction_message(itx, embed=embed, view=view)
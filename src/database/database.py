@@ -6,12 +6,17 @@ the wrapper will provide a method to check the validity of the
 data passed to it, to be used by the user of the wrapper.
 """
 
+import asyncio
 import datetime
 import enum
+import logging
 import inspect
-from typing import Any, Callable, Optional
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Generic, Optional, TypeVar
 import asyncpg
-from .database_types import Response, Task, autowrap
+from .database_types import Response, Task, columns
+from ..utils.journal import JournalEntry
 import time
 
 
@@ -33,15 +38,69 @@ class HuskyPool(asyncpg.Pool):
         )
 
 
+R = TypeVar("R")
+
+
+class Query(Generic[R]):
+    """A statement declared once, as a class attribute of a `HuskyWrapper`. With a
+    `row` record class, `{columns}` in `sql` becomes its column list and rows come
+    back as `row` instances, built by asyncpg itself."""
+
+    def __init__(self, sql: str, row: Optional[type[R]] = None):
+        self.sql = sql.format(columns=columns(row)) if row is not None else sql
+        self.record_class = row
+
+    async def run(self, conn: asyncpg.Connection, method: str, *args) -> Any:
+        """Runs `conn.<method>(sql, *args)`, passing `record_class` to `fetch` and
+        `fetchrow`. Nothing is prepared explicitly: asyncpg's implicit statement
+        cache reuses the statement on each connection that has run it before."""
+        if method in ("fetch", "fetchrow") and self.record_class is not None:
+            return await getattr(conn, method)(
+                self.sql, *args, record_class=self.record_class
+            )
+        return await getattr(conn, method)(self.sql, *args)
+
+
 class HuskyWrapper:
+    """Queries against the tables of one part of the bot. The tables themselves
+    are created and changed by `migrations.migrate`."""
+
     def __init__(self, pool: HuskyPool):
         self.pool = pool
 
-    async def make_table(self) -> None:
-        """
-        Creates the table for the wrapper if it doesn't exist.
-        """
-        raise NotImplementedError
+    @asynccontextmanager
+    async def connection(
+        self, conn: Optional[asyncpg.Connection] = None
+    ) -> AsyncIterator[asyncpg.Connection]:
+        if conn is not None:
+            yield conn
+        else:
+            async with self.pool.acquire() as conn:
+                yield conn
+
+    async def fetch(
+        self, query: Query[R], *args, conn: Optional[asyncpg.Connection] = None
+    ) -> list[R]:
+        async with self.connection(conn) as c:
+            return await query.run(c, "fetch", *args)
+
+    async def fetchrow(
+        self, query: Query[R], *args, conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[R]:
+        async with self.connection(conn) as c:
+            return await query.run(c, "fetchrow", *args)
+
+    async def fetchval(
+        self, query: Query, *args, conn: Optional[asyncpg.Connection] = None
+    ) -> Any:
+        async with self.connection(conn) as c:
+            return await query.run(c, "fetchval", *args)
+
+    async def execute(
+        self, query: Query, *args, conn: Optional[asyncpg.Connection] = None
+    ) -> None:
+        async with self.connection(conn) as c:
+            await query.run(c, "execute", *args)
 
     async def drop_table(self) -> None:
         """
@@ -51,13 +110,28 @@ class HuskyWrapper:
 
 
 class Users(HuskyWrapper):
-    async def make_table(self) -> None:
-        await self.pool.execute(
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                user_id BIGINT PRIMARY KEY
-            )"""
-        )
+    """Besides the table, keeps the set of user ids known to have a row, so
+    `user_check` only goes to the database for users it hasn't seen. Ids it
+    hasn't seen are collected for `flush_delay` seconds and inserted together."""
+
+    _all_ids = Query("SELECT user_id FROM users")
+    _insert_ids = Query(
+        """
+        INSERT INTO users (user_id)
+        SELECT unnest($1::BIGINT[])
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+    def __init__(self, pool: HuskyPool, flush_delay: float = 0.2):
+        super().__init__(pool)
+        self.flush_delay = flush_delay
+        self.known: set[int] = set()
+        """Ids with a row in `users`. Filled by `warm` and by each flush."""
+        self._pending: set[int] = set()
+        self._flushed: Optional[asyncio.Future] = None
+        """Resolves once `_pending` is in the table."""
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def drop_table(self) -> None:
         await self.pool.execute(
@@ -65,36 +139,43 @@ class Users(HuskyWrapper):
             DROP TABLE IF EXISTS users
             """
         )
+        self.known.clear()
 
-    async def user_check(self, user_id: int) -> None:
-        await self.pool.execute(
-            """
-            INSERT INTO users (user_id)
-            VALUES ($1)
-            ON CONFLICT DO NOTHING
-            """,
-            user_id,
-        )
+    async def warm(self) -> None:
+        """Loads every existing id into `known`."""
+        self.known.update(r[0] for r in await self.fetch(self._all_ids))
 
+    async def user_check(self, user_id: int, *, wait: bool = True) -> None:
+        """Makes sure `user_id` has a row. Returns at once for known ids; otherwise
+        queues the id for the next batched insert and, if `wait`, returns once it
+        is in (raising if the insert failed). Waiting for an unknown id costs up to
+        `flush_delay` (200ms by default) plus the insert, once per user per
+        process. Pass `wait=False` when nothing is about to reference the row."""
+        if user_id in self.known:
+            return
+        self._pending.add(user_id)
+        if self._flushed is None:
+            self._flushed = asyncio.get_running_loop().create_future()
+            self._flush_task = asyncio.create_task(self._flush(self._flushed))
+        if wait:
+            await asyncio.shield(self._flushed)
+
+    async def _flush(self, flushed: asyncio.Future) -> None:
+        await asyncio.sleep(self.flush_delay)
+        ids, self._pending = self._pending, set()
+        self._flushed = None
+        try:
+            await self.execute(self._insert_ids, list(ids))
+        except Exception as e:
+            logging.exception(f"inserting {len(ids)} users failed")
+            flushed.set_exception(e)
+            flushed.exception()  # logged above, don't warn again if nobody waited
+            return
+        self.known.update(ids)
+        flushed.set_result(None)
 
-class TODO(HuskyWrapper):
-    async def make_table(self) -> None:
-        await self.pool.execute(
-            """
-            CREATE TABLE IF NOT EXISTS todo (
-                task_id SERIAL PRIMARY KEY,
-                user_id BIGINT NOT NULL,
-                task TEXT NOT NULL UNIQUE,
-                date DATE,
-                time TIME,
-                remind_type INT,
-                datetime_created TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
-                UNIQUE (user_id, task)
-            )
-            """
-        )
 
+class TODO(HuskyWrapper):
     async def drop_table(self) -> None:
         await self.pool.execute(
             """
@@ -134,82 +215,130 @@ class TODO(HuskyWrapper):
         except asyncpg.UniqueViolationError:
             raise ValueError("Task already exists")
 
-    async def get_todo_by_id(self, task_id: int) -> Task:
-        task = autowrap(
-            Task,
-            await self.pool.fetchrow(
-                """
-            SELECT * FROM todo
-            WHERE task_id = $1
-            """,
-                task_id,
-            ),
-        )
-        return task
+    _task_by_id = Query("SELECT {columns} FROM todo WHERE task_id = $1", Task)
+    _user_tasks = Query("SELECT {columns} FROM todo WHERE user_id = $1", Task)
+    _user_tasks_page = Query(
+        """
+        SELECT {columns} FROM todo
+        WHERE user_id = $1
+        AND ($4::DATE IS NULL OR (date <= $4::DATE AND time < $5::TIME))
+        ORDER BY date ASC NULLS LAST, time ASC NULLS FIRST, task_id
+        LIMIT $2 OFFSET $3
+        """,
+        Task,
+    )
+    _count_user_tasks = Query(
+        """
+        SELECT COUNT(*) FROM todo
+        WHERE user_id = $1
+        AND ($2::DATE IS NULL OR (date <= $2::DATE AND time < $3::TIME))
+        """
+    )
+    _overdue_tasks = Query(
+        """
+        SELECT {columns} FROM todo
+        WHERE time < CURRENT_TIME - $1::INTERVAL AND date <= CURRENT_DATE
+        """,
+        Task,
+    )
+    _user_overdue_tasks = Query(
+        """
+        SELECT {columns} FROM todo
+        WHERE user_id = $1 AND date < CURRENT_DATE
+        """,
+        Task,
+    )
+    _trim_overdue_tasks = Query(
+        """
+        DELETE FROM todo
+        WHERE date < CURRENT_DATE - $1::INTERVAL
+        RETURNING {columns}
+        """,
+        Task,
+    )
+    _delete_task = Query("DELETE FROM todo WHERE task_id = $1")
+    _delete_user_tasks = Query("DELETE FROM todo WHERE user_id = $1")
+
+    async def get_todo_by_id(self, task_id: int) -> Optional[Task]:
+        return await self.fetchrow(self._task_by_id, task_id)
 
     async def get_user_tasks(self, user_id: int) -> list[Task]:
-        tasks = [
-            autowrap(Task, t)
-            for t in await self.pool.fetch(
-                """
-            SELECT * FROM todo
-            WHERE user_id = $1
-            """,
-                user_id,
-            )
-        ]
-        return tasks
+        return await self.fetch(self._user_tasks, user_id)
+
+    async def get_user_tasks_page(
+        self,
+        user_id: int,
+        offset: int,
+        limit: int,
+        overdue_before: datetime.datetime | None = None,
+    ) -> list[Task]:
+        """One page of the user's tasks, soonest first and undated tasks last. With
+        `overdue_before`, only tasks due on or before its date and before its time."""
+        return await self.fetch(
+            self._user_tasks_page,
+            user_id,
+            limit,
+            offset,
+            overdue_before and overdue_before.date(),
+            overdue_before and overdue_before.time(),
+        )
+
+    async def count_user_tasks(
+        self, user_id: int, overdue_before: datetime.datetime | None = None
+    ) -> int:
+        """How many tasks `get_user_tasks_page` pages through."""
+        return await self.fetchval(
+            self._count_user_tasks,
+            user_id,
+            overdue_before and overdue_before.date(),
+            overdue_before and overdue_before.time(),
+        )
 
     async def get_overdue_tasks(self, threshold_sec: int = 0) -> list[Task]:
-        tasks = [
-            autowrap(Task, t)
-            for t in await self.pool.fetch(
-                """
-                    SELECT * FROM todo
-                    WHERE time < CURRENT_TIME - $1::INTERVAL AND date <= CURRENT_DATE
-                """,
-                datetime.timedelta(seconds=threshold_sec),
-            )
-        ]
-        return tasks
+        return await self.fetch(
+            self._overdue_tasks, datetime.timedelta(seconds=threshold_sec)
+        )
 
     async def get_user_overdue_tasks(self, user_id: int) -> list[Task]:
-        tasks = [
-            autowrap(Task, t)
-            for t in await self.pool.fetch(
-                """
-            SELECT * FROM todo
-            WHERE user_id = $1 AND date < CURRENT_DATE
-            """,
-                user_id,
-            )
-        ]
-        return tasks
+        return await self.fetch(self._user_overdue_tasks, user_id)
 
     async def trim_overdue_tasks(self, min_overdue_seconds: int = 0) -> list[Task]:
-        return await self.pool.fetch(
-            """
-            DELETE FROM todo
-            WHERE date < CURRENT_DATE - $1::INTERVAL
-            RETURNING *
-            """,
-            datetime.timedelta(seconds=min_overdue_seconds),
+        return await self.fetch(
+            self._trim_overdue_tasks, datetime.timedelta(seconds=min_overdue_seconds)
         )
 
     async def delete_task(self, task_id: int) -> None:
+        await self.execute(self._delete_task, task_id)
+
+    async def delete_user_tasks(self, user_id: int) -> None:
+        await self.execute(self._delete_user_tasks, user_id)
+
+
+class Journal(HuskyWrapper):
+    async def drop_table(self) -> None:
         await self.pool.execute(
             """
-            DELETE FROM todo
-            WHERE task_id = $1
-            """,
-            task_id,
+            DROP TABLE IF EXISTS command_journal
+            """
         )
 
-    async def delete_user_tasks(self, user_id: int) -> None:
-        await self.pool.execute(
+    async def add_entries(self, entries: list[JournalEntry]) -> None:
+        await self.pool.executemany(
             """
-            DELETE FROM todo
-            WHERE user_id = $1
+            INSERT INTO command_journal
+                (user_id, channel_id, command, content, args, attachments, invoked_at)
+            VALUES ($1, $2, $3, $4, $5, $6, $7)
             """,
-            user_id,
+            [
+                (
+                    e.user_id,
+                    e.channel_id,
+                    e.command,
+                    e.content,
+                    e.args,
+                    json.dumps(e.attachments),
+                    e.timestamp,
+                )
+                for e in entries
+            ],
         )
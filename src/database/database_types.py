@@ -2,7 +2,9 @@ from dataclasses import dataclass as dc_dataclass
 from dataclasses import fields as dc_fields
 import datetime
 from abc import ABC
-from typing import Any, Type, TypeVar
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Type, TypeVar
+import asyncpg
 from enum import Enum
 
 AnyDataClass = TypeVar("AnyDataClass", bound=Type[dc_dataclass])
@@ -21,15 +23,37 @@ class Response(Enum):
     CANCEL = 9
 
 
-@dc_dataclass
-class Task:
-    task_id: int
-    user_id: int
-    task: str
-    date: datetime.date | None
-    time: datetime.time | None
-    remind_type: int
-    datetime_created: datetime.datetime
+class Task(asyncpg.Record):
+    """A row of `todo`. asyncpg builds these directly (`Query` passes
+    `record_class=Task` to `fetch`/`fetchrow`), so a task is a tuple of its columns
+    with no `__dict__` and no intermediate mapping. Columns are read by attribute,
+    by key or by index. Can't be constructed from Python."""
+
+    __slots__ = ()
+    COLUMNS = (
+        "task_id",
+        "user_id",
+        "task",
+        "date",
+        "time",
+        "remind_type",
+        "datetime_created",
+    )
+    """In the order queries must select them, see `columns`."""
+
+    if TYPE_CHECKING:
+        task_id: int
+        user_id: int
+        task: str
+        date: datetime.date | None
+        time: datetime.time | None
+        remind_type: int
+        datetime_created: datetime.datetime
+
+
+for _index, _name in enumerate(Task.COLUMNS):
+    setattr(Task, _name, property(itemgetter(_index), doc=f"The `{_name}` column."))
+del _index, _name
 
 
 def autowrap(
@@ -47,3 +71,8 @@ def autowrap(
                 f"Dataclass attribute '{f.name}' ({f}) missing from input data"
             ) from e
     return dc(**kwargs)
+
+
+def columns(row: type[asyncpg.Record]) -> str:
+    """The column list to select for `row`, i.e. its `COLUMNS`."""
+    return ", ".join(row.COLUMNS)
@@ -0,0 +1,116 @@
+"""
+Versioned schema changes. Each migration runs once per database, in its own
+transaction, and is recorded in `schema_migrations`. Steps are written to be
+idempotent as well, so a database whose tables predate this module (created
+by the old per-wrapper `make_table` methods) is brought up to date without
+errors. This is the only place the schema is defined.
+"""
+
+import logging
+from typing import NamedTuple
+
+import asyncpg
+
+LOCK_KEY = 0x6875736B79  # "husky"
+"""`pg_advisory_lock` key held while migrating, so only one process migrates at a time."""
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    sql: str
+
+
+MIGRATIONS = [
+    Migration(
+        1,
+        "create users and todo",
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            user_id BIGINT PRIMARY KEY
+        );
+        CREATE TABLE IF NOT EXISTS todo (
+            task_id SERIAL PRIMARY KEY,
+            user_id BIGINT NOT NULL,
+            task TEXT NOT NULL UNIQUE,
+            date DATE,
+            time TIME,
+            remind_type INT,
+            datetime_created TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
+            UNIQUE (user_id, task)
+        );
+        """,
+    ),
+    Migration(
+        2,
+        "allow the same task for different users",
+        # only (user_id, task) should be unique
+        "ALTER TABLE todo DROP CONSTRAINT IF EXISTS todo_task_key;",
+    ),
+    Migration(
+        3,
+        "index todo for per-user and overdue lookups",
+        """
+        CREATE INDEX IF NOT EXISTS todo_user_due
+            ON todo (user_id, date, time NULLS FIRST, task_id);
+        CREATE INDEX IF NOT EXISTS todo_due
+            ON todo (date, time) WHERE date IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS todo_user_undated
+            ON todo (user_id, time) WHERE date IS NULL;
+        """,
+    ),
+    Migration(
+        4,
+        "create command_journal",
+        """
+        CREATE TABLE IF NOT EXISTS command_journal (
+            entry_id BIGSERIAL PRIMARY KEY,
+            user_id BIGINT NOT NULL,
+            channel_id BIGINT NOT NULL,
+            command TEXT NOT NULL,
+            content TEXT NOT NULL,
+            args TEXT NOT NULL,
+            attachments TEXT NOT NULL,
+            invoked_at TIMESTAMP NOT NULL
+        );
+        """,
+    ),
+]
+"""In version order. Append only: never edit a migration that has shipped."""
+
+
+async def migrate(pool: asyncpg.Pool) -> list[Migration]:
+    """Applies the migrations the database hasn't seen yet and returns them."""
+    applied = []
+    async with pool.acquire() as conn:
+        await conn.execute("SELECT pg_advisory_lock($1)", LOCK_KEY)
+        try:
+            await conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version INT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            done = {
+                r["version"]
+                for r in await conn.fetch("SELECT version FROM schema_migrations")
+            }
+            for migration in MIGRATIONS:
+                if migration.version in done:
+                    continue
+                async with conn.transaction():
+                    await conn.execute(migration.sql)
+                    await conn.execute(
+                        "INSERT INTO schema_migrations (version, name) VALUES ($1, $2)",
+                        migration.version,
+                        migration.name,
+                    )
+                logging.info(f"applied migration {migration.version}: {migration.name}")
+                applied.append(migration)
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", LOCK_KEY)
+    return applied
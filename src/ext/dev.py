@@ -1,7 +1,16 @@
-from typing import Optional
+import copy
+import cProfile
+import threading
+from io import BytesIO
+from time import perf_counter
+from typing import Literal, Optional
+import discord
 from discord.ext import commands
 
 from ..cls_bot import HuskyContext, Husky, HuskyCog
+from ..utils.journal import replay_message
+from ..utils.profiling import StackSampler, hotspot_table
+from ..bench import run_db_benchmark, run_embed_benchmark
 
 
 class Dev(HuskyCog):
@@ -11,45 +20,275 @@ class Dev(HuskyCog):
 
     @commands.command(name="sync")
     @commands.is_owner()
-    async def sync_(self, ctx: HuskyContext):
-        surface = await self.bot.tree.sync()
-        await ctx.send(f"Synced {len(surface)} surface commands.")
+    async def sync_(self, ctx: HuskyContext, force: Optional[Literal["force"]] = None):
+        """Syncs the application commands if they changed since the last sync.
+        `sync force` syncs regardless."""
+        diff = await self.bot.sync_commands(force=force is not None)
+        if diff is None:
+            await ctx.send("Application commands unchanged, nothing synced.")
+        else:
+            await ctx.send(f"Synced application commands: {diff.describe()}.")
 
     @commands.command(name="reload", aliases=["r"])
     @commands.is_owner()
     async def reload_(self, ctx: HuskyContext, *, ext_name: Optional[str]):
-        if ext_name is not None:
+        """Reloads the extensions and utils that changed since they were last loaded
+        (and whatever depends on them). `reload all` reloads everything, `reload <ext>`
+        a single extension."""
+        if ext_name is not None and ext_name != "all":
             ext = "src.ext." + ext_name
+            if ext in self.bot.lazy_extensions:
+                # still only stubs: importing it replaces them
+                await self.bot.load_lazy_extension(ext)
+                await self.bot.mark_loaded(ext)
+                await ctx.send(f"Loaded lazy extension `{ext}`.")
+                return
             try:
-                self.bot.reload_extension(ext)
+                await self.bot.reload_extension(ext)
             except commands.ExtensionNotLoaded:
-                self.bot.load_extension(ext)
-            except commands.ExtensionNotFound:
-                await ctx.send(f"Extension `{ext}` not found.")
+                try:
+                    await self.bot.load_extension(ext)
+                except commands.ExtensionNotFound:
+                    await ctx.send(f"Extension `{ext}` not found.")
+                    return
 
+            self.bot.index_commands()
+            await self.bot.mark_loaded(ext)
             await ctx.send(f"Reloaded extension `{ext}`.")
+            return
+
+        result = await self.bot.reload_extensions(changed_only=ext_name is None)
+        embed = ctx.embed(title="Reloaded extensions")
+        lines = [
+            f"**`{e.filename.ljust(15, '.')}`**`[{e.path}]`" for e in result.extensions
+        ]
+        lines += [f"*`{u.filename.ljust(15, '.')}`*`[{u.path}]`" for u in result.utils]
+        lines += [
+            f"~~`{s.filename.ljust(15, '.')}`~~`[{s.path}]` (restart required)"
+            for s in result.skipped
+        ]
+        embed.description = "\n".join(lines) or "Nothing changed."
+        await ctx.send(embed=embed)
+
+    @commands.command(name="up", extras={"journal": False})
+    @commands.is_owner()
+    async def up_(self, ctx: HuskyContext):
+        # do the last command by this user
+        entries = self.bot.journal.last(ctx.author.id)
+        if not entries:
+            await ctx.send("No commands recorded for you yet.")
+            return
+        await self.bot.process_commands(replay_message(ctx.message, entries[0]))
+
+    @commands.command(name="replay", extras={"journal": False})
+    @commands.is_owner()
+    async def replay_(
+        self, ctx: HuskyContext, n: int = 1, user: Optional[discord.User] = None
+    ):
+        """Re-runs the last `n` commands of `user` (default: you), oldest first."""
+        user = user or ctx.author
+        entries = self.bot.journal.last(user.id, n)
+        if not entries:
+            await ctx.send(f"No commands recorded for {user.display_name}.")
+            return
+
+        embed = ctx.embed(title=f"Replaying {len(entries)} commands")
+        embed.description = "\n".join(
+            f"`{e.timestamp:%H:%M:%S}` `{e.content}`" for e in entries
+        )
+        await ctx.send(embed=embed)
+        for entry in entries:
+            await self.bot.process_commands(replay_message(ctx.message, entry))
+
+    @commands.command(name="profile", extras={"journal": False})
+    @commands.is_owner()
+    async def profile_(self, ctx: HuskyContext, *, command: str):
+        """Runs `command` once under cProfile and replies with its hotspots. Start with
+        `--stacks` to also sample the loop thread, list its hottest leaf frames and
+        attach collapsed stacks, which flamegraph tools can render. Anything else the
+        loop runs meanwhile is profiled too."""
+        sample = command.startswith("--stacks ")
+        command = command.removeprefix("--stacks ").strip()
+
+        message = copy.copy(ctx.message)
+        message.content = f"{self.bot.prefix}{command}"
+        target = await self.bot.get_context(message)
+        if target.command is None:
+            await ctx.send(f"Command `{command}` not found.")
+            return
+
+        profiler = cProfile.Profile()
+        sampler = StackSampler(threading.get_ident()) if sample else None
+        if sampler is not None:
+            sampler.start()
+        start = perf_counter()
+        profiler.enable()
+        try:
+            await self.bot.invoke(target)
+        finally:
+            profiler.disable()
+            elapsed = perf_counter() - start
+            if sampler is not None:
+                sampler.stop()
+
+        report = hotspot_table(profiler)
+        if sampler is not None:
+            total = sum(sampler.stacks.values()) or 1
+            report += "\n==== sampled leaf frames ====\n" + "\n".join(
+                f"{n:>8}{n / total:>8.1%}  {leaf}" for leaf, n in sampler.hotspots()
+            )
+        files = [discord.File(BytesIO(report.encode()), filename="profile.txt")]
+        if sampler is not None:
+            files.append(
+                discord.File(
+                    BytesIO(sampler.collapsed().encode()), filename="stacks.collapsed"
+                )
+            )
+        await ctx.send(
+            f"Profiled `{target.command.qualified_name}` in `{elapsed * 1000:.1f}ms`.",
+            files=files,
+        )
+
+    @commands.command(name="traces")
+    @commands.is_owner()
+    async def traces_(self, ctx: HuskyContext, clear: bool = False):
+        report = self.bot.traces.report()
+        if not report:
+            await ctx.send("No spans recorded yet.")
+            return
+
+        lines = [
+            f"{'command':<24}{'span':<12}{'n':>7}{'p50':>10}{'p95':>10}{'p99':>10}",
+        ]
+        for stats in report:
+            h = stats.histogram
+            lines.append(
+                f"{stats.command:<24}{stats.span:<12}{h.count:>7}"
+                + "".join(f"{h.percentile(p) * 1000:>8.1f}ms" for p in (50, 95, 99))
+            )
+        table = "\n".join(lines)
+
+        if len(table) > 1900:
+            file = discord.File(BytesIO(table.encode()), filename="traces.txt")
+            await ctx.send(file=file)
         else:
-            await self.bot.reload_extensions()  # load twice
-            ext, util = await self.bot.reload_extensions()
-            embed = ctx.embed(title="Reloaded extensions")
-            desc = "\n".join(
-                f"**`{e.filename.ljust(15, '.')}`**`[{e.path}]`" for e in ext
+            await ctx.send(f"```{table}```")
+
+        if clear:
+            self.bot.traces.clear()
+
+    @commands.command(name="stalls")
+    @commands.is_owner()
+    async def stalls_(self, ctx: HuskyContext, clear: bool = False):
+        monitor = self.bot.stall_monitor
+        lag = monitor.lag
+        summary = (
+            f"Loop lag over {lag.count} heartbeats: "
+            + ", ".join(f"p{p} `{lag.percentile(p) * 1000:.1f}ms`" for p in (50, 99))
+            + f" (threshold `{monitor.threshold * 1000:.0f}ms`)"
+        )
+        report = monitor.report()
+        if not report:
+            await ctx.send(f"{summary}\nNo stalls recorded.")
+        else:
+            lines = [f"{'command':<20}{'n':>5}{'total':>10}{'worst':>10}  at"]
+            for s in report:
+                lines.append(
+                    f"{s.command or '-':<20}{s.count:>5}"
+                    f"{s.total * 1000:>8.0f}ms{s.worst * 1000:>8.0f}ms  {s.leaf}"
+                )
+            table = "\n".join(lines)
+            file = discord.File(
+                BytesIO(monitor.collapsed().encode()), filename="stalls.collapsed"
             )
-            desc += "\n"
-            desc += "\n".join(
-                f"*`{u.filename.ljust(15, '.')}`*`[{u.path}]`" for u in util
+            await ctx.send(f"{summary}\n```{table[:1800]}```", file=file)
+
+        if clear:
+            monitor.clear()
+
+    @commands.command(name="http")
+    @commands.is_owner()
+    async def http_(self, ctx: HuskyContext):
+        hosts = self.bot.web_client.hosts
+        if not hosts:
+            await ctx.send("No outside requests made yet.")
+            return
+
+        lines = [f"{'host':<24}{'n':>6}{'err':>5}{'read':>10}{'p50':>10}{'p95':>10}"]
+        for host, s in sorted(hosts.items(), key=lambda h: -h[1].requests):
+            lines.append(
+                f"{host[:23]:<24}{s.requests:>6}{s.errors:>5}{s.bytes / 1024:>8.0f}KB"
+                + "".join(f"{s.latency.percentile(p) * 1000:>8.0f}ms" for p in (50, 95))
             )
-            embed.description = desc
-            await ctx.send(embed=embed)
+        await ctx.send(f"```{chr(10).join(lines)}```")
 
-    @commands.command(name="up")
+    @commands.command(name="gate")
     @commands.is_owner()
-    async def up_(self, ctx: HuskyContext):
-        # do the last command by this user
-        async for msg in ctx.channel.history(limit=100):
-            if msg.author == ctx.author:
-                await self.bot.process_commands(msg)
-                return
+    async def gate_(self, ctx: HuskyContext):
+        stats = self.bot.gate.stats()
+        total = sum(stats.values())
+        lines = [f"{'outcome':<10}{'n':>10}{'share':>8}"]
+        for outcome, n in stats.items():
+            lines.append(f"{outcome:<10}{n:>10}{n / total:>8.1%}")
+        lines.append(f"{'total':<10}{total:>10}")
+        await ctx.send(f"```{chr(10).join(lines)}```")
+
+    @commands.command(name="views")
+    @commands.is_owner()
+    async def views_(self, ctx: HuskyContext):
+        views = self.bot.views
+        size = views.report()
+        lines = [
+            f"open      {len(views):>6} / {views.max_views} ({views.max_per_user} per user)",
+            f"approx    {size.approx_bytes / 1024:>6.1f}KB",
+            f"expired   {views.expired:>6}",
+            f"evicted   {views.evicted:>6}",
+        ]
+        for owner_id, n in views.top_owners():
+            lines.append(f"  {owner_id:<22}{n:>3}")
+        await ctx.send(f"```{chr(10).join(lines)}```")
+
+    @commands.group(name="bench", invoke_without_command=True)
+    @commands.is_owner()
+    async def bench_(self, ctx: HuskyContext):
+        await ctx.send(
+            f"Usage: `{self.bot.prefix}bench embeds [n]`, `{self.bot.prefix}bench db [n]`"
+        )
+
+    @bench_.command(name="embeds")
+    @commands.is_owner()
+    async def bench_embeds(self, ctx: HuskyContext, n: int = 10_000):
+        table = run_embed_benchmark(self.bot.embeds, ctx.author, n)
+        await ctx.send(f"```{table}```")
+
+    @bench_.command(name="db")
+    @commands.is_owner()
+    async def bench_db(self, ctx: HuskyContext, n: int = 200):
+        table = await run_db_benchmark(self.bot.db_todo, ctx.author.id, n)
+        await ctx.send(f"```{table}```")
+
+    @commands.command(name="caches", aliases=["mem"])
+    @commands.is_owner()
+    async def caches_(self, ctx: HuskyContext):
+        report = self.bot.cache_report()
+        lines = [f"{'cache':<10}{'count':>10}{'approx':>12}"]
+        for c in report:
+            lines.append(f"{c.name:<10}{c.count:>10}{c.approx_bytes / 1024:>10.1f}KB")
+        total = sum(c.approx_bytes for c in report)
+        lines.append(f"{'total':<10}{'':>10}{total / 1024:>10.1f}KB")
+
+        embed = ctx.embed(
+            title="Cache memory", description=f"```{chr(10).join(lines)}```"
+        )
+        embed.add_field(name="Intents", value=f"`{self.bot.intents.value}`")
+        embed.add_field(
+            name="Member cache",
+            value=f"`{self.bot._connection.member_cache_flags.value}`",
+        )
+        embed.add_field(
+            name="Max messages", value=f"`{self.bot._connection.max_messages}`"
+        )
+        await ctx.send(embed=embed)
 
     @commands.command()
     @commands.is_owner()
@@ -39,7 +39,7 @@ class Help(HuskyCog):
                 embed = await Help.command_help_embed(ctx, found_command)
                 view = await Help.command_help_view(ctx, found_command)
                 message = await ctx.send(embed=embed, view=view)
-                view.message = message
+                view.attach(ctx, message)
 
         if group is not None and command is None:
             found_group = self.bot.get_command(group)
@@ -53,7 +53,7 @@ class Help(HuskyCog):
             embed = await Help.group_help_embed(ctx, found_group)
             view = await Help.group_help_view(ctx, found_group)
             message = await ctx.send(embed=embed, view=view)
-            view.message = message
+            view.attach(ctx, message)
 
         elif cog is not None:
             found_cog = self.bot.get_cog(cog)
@@ -63,7 +63,7 @@ class Help(HuskyCog):
             embed = await Help.cog_help_embed(ctx, found_cog)
             view = await Help.cog_help_view(ctx, found_cog)
             message = await ctx.send(embed=embed, view=view)
-            view.message = message
+            view.attach(ctx, message)
 
     @help.autocomplete(name="command")
     async def help_command_autocomplete(
@@ -325,7 +325,7 @@ class CommandSelect(discord.ui.Select):
         command = self.ctx.bot.get_command(self.values[0])
         embed = await Help.command_help_embed(self.ctx, command)
         view = await Help.command_help_view(self.ctx, command)
-        await interaction.response.edit_message(embed=embed, view=view)
+        await self.view.replace(interaction, self.ctx, view, embed=embed)
 
 
 class CogSelect(discord.ui.Select):
@@ -347,7 +347,7 @@ class CogSelect(discord.ui.Select):
         cog = self.ctx.bot.get_cog(self.values[0])
         embed = await Help.cog_help_embed(self.ctx, cog)
         view = await Help.cog_help_view(self.ctx, cog)
-        await interaction.response.edit_message(embed=embed, view=view)
+        await self.view.replace(interaction, self.ctx, view, embed=embed)
 
 
 async def setup(bot: Husky):
@@ -49,10 +49,11 @@ class Image(HuskyCog):
             The color to use for the background.
         """
         wimage = await convert_image(image)
-        wimage.rotate(
-            degrees,
-            background=WandColor(background.to_hex()),
-        )
+        with ctx.span("process"):
+            wimage.rotate(
+                degrees,
+                background=WandColor(background.to_hex()),
+            )
         await sendoff(ctx, wimage, f"Rotated {degrees} degrees")
 
     @image.command(aliases=["flop", "flip"])
@@ -77,10 +78,11 @@ class Image(HuskyCog):
         direction = (
             {"h": "horizontal", "v": "vertical"}.get(direction, direction).lower()
         )
-        if direction == "horizontal":
-            wimage.flop()
-        elif direction == "vertical":
-            wimage.flip()
+        with ctx.span("process"):
+            if direction == "horizontal":
+                wimage.flop()
+            elif direction == "vertical":
+                wimage.flip()
 
         await sendoff(ctx, wimage, f"Mirrored {direction}")
 
@@ -139,7 +141,8 @@ class Image(HuskyCog):
                 f"Image is too large to rescale. Maximum is {MAX_RESCALE_PIXELS} pixels."
             )
 
-        wimage.resize(width, height)
+        with ctx.span("process"):
+            wimage.resize(width, height)
         await sendoff(
             ctx,
             wimage,
@@ -196,7 +199,8 @@ class Image(HuskyCog):
             raise commands.BadArgument("You must provide either `height` or `end_y`.")
 
         # no need to calculate the other bits, because wand will do it for us
-        wimage.crop(start_x, start_y, end_x, end_y, width, height)
+        with ctx.span("process"):
+            wimage.crop(start_x, start_y, end_x, end_y, width, height)
 
         await sendoff(
             ctx,
@@ -228,7 +232,8 @@ class Image(HuskyCog):
             The width of the border.
         """
         wimage = await convert_image(image)
-        wimage.border(WandColor(color.to_hex()), width=width, height=height)
+        with ctx.span("process"):
+            wimage.border(WandColor(color.to_hex()), width=width, height=height)
         await sendoff(ctx, wimage, f"Added a `{width}x{height} px` `{color}` border")
 
     @image.command()
@@ -250,7 +255,8 @@ class Image(HuskyCog):
             The sigma value to use for the blur. The higher it is, the more blurred the image will be.
         """
         wimage = await convert_image(image)
-        wimage.blur(sigma=sigma)
+        with ctx.span("process"):
+            wimage.blur(sigma=sigma)
         await sendoff(ctx, wimage, "Blurred image")
 
     @image.command(aliases=["shrp"])
@@ -277,7 +283,8 @@ class Image(HuskyCog):
         """
 
         wimage = await convert_image(image)
-        wimage.sharpen(radius=radius, sigma=sigma)
+        with ctx.span("process"):
+            wimage.sharpen(radius=radius, sigma=sigma)
         await sendoff(ctx, wimage, "Sharpened image")
 
 
@@ -88,7 +88,8 @@ class Paint(HuskyCog):
                     left=0, top=256 - 256 % pixels_per_color, right=256, bottom=256
                 )
 
-        d.draw(wimage)
+        with ctx.span("process"):
+            d.draw(wimage)
 
         await sendoff(ctx, wimage, str(colors))
 
@@ -179,7 +180,8 @@ class Paint(HuskyCog):
             elif direction in ("vertical", "v"):
                 d.rectangle(left=0, top=256 - 256 % GRANULARITY, right=256, bottom=256)
 
-        d.draw(wimage)
+        with ctx.span("process"):
+            d.draw(wimage)
 
         await sendoff(ctx, wimage, str(colors))
 
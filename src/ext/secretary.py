@@ -8,11 +8,20 @@ from ..utils.types import Indicies
 # from discord.app_commands import
 
 from ..cls_bot import HuskyContext, Husky, HuskyCog
-from ..cls_ext import HuskyModal, HuskyView, HuskyPanel, HuskyPaginator
+from ..cls_ext import (
+    HuskyModal,
+    OwnedItem,
+    PageButton,
+    PersistentPaginator,
+    disabled_view,
+    edit_interaction_message,
+)
 from ..utils.converters import convert_date, convert_time
 
 import datetime
+import re
 import time
+from functools import cached_property
 
 
 class Secretary(HuskyCog):
@@ -22,6 +31,11 @@ class Secretary(HuskyCog):
         super().__init__(bot, emoji="\N{BRIEFCASE}")
         self.bot = bot
 
+    async def cog_load(self) -> None:
+        # so buttons on messages sent before a restart still work
+        self.bot.add_dynamic_items(PageButton, DraftButton, DraftRemindSelect)
+        await super().cog_load()
+
     @commands.hybrid_group()
     async def todo(self, ctx: HuskyContext, *, task: str = ""):
         """Base command for the group."""
@@ -48,26 +62,14 @@ class Secretary(HuskyCog):
         embed.add_field(name="Time", value="Not Set")
         embed.add_field(name="Remind Type", value="Not Set [None]")
 
-        view = AddTaskView(ctx, embed)
-        message = await ctx.send(embed=embed, view=view)
-
-        view.message = message
+        await ctx.send(embed=embed, view=AddTaskView(ctx.author.id))
 
     @todo.command(aliases=["l"])
     async def list(self, ctx: HuskyContext, overdue_only: bool = False):
         """Lists all of your tasks"""
-        tasks = await self.bot.db_todo.get_user_tasks(ctx.author.id)
-        if overdue_only:
-            print(tasks)
-            tasks = [
-                f
-                for f in tasks
-                if f.date is not None and f.date <= datetime.datetime.now().date() and
-                    f.time is not None and f.time < datetime.datetime.now().time()
-            ]
-            print(tasks)
-
-        if len(tasks) == 0:
+        pages = TaskPages(self.bot, ctx.author, "overdue" if overdue_only else "")
+        built = await pages.build()
+        if built is None:
             if overdue_only:
                 embed = ctx.embed(
                     title="\N{White heavy check mark} You have no overdue tasks"
@@ -76,44 +78,69 @@ class Secretary(HuskyCog):
                 embed = ctx.embed(title="\N{White heavy check mark} You have no tasks")
             return await ctx.send(embed=embed)
 
-        embed = ctx.embed(title="\N{Memo} Your Tasks", description="processing...")
-        tasks = sorted(tasks, key=lambda x: (x.date or datetime.datetime(1,1,1,0,0,0,0).date(), x.time or datetime.time(0, 0, 0, 0)))
-        for i, t in enumerate(tasks):
-            if t.date is None:
-                del tasks[i]
-                tasks.append(t)
-
-        view = TaskPaginator(ctx, tasks, 5)
-        message = await ctx.send(embed=embed, view=view)
-        view.message = message
-        await view.update_view()
-
+        embed, view = built
+        await ctx.send(embed=embed, view=view)
+
+
+class AddTaskView(discord.ui.View):
+    """The task draft panel. The draft itself lives in the message's embed and the
+    owner in the custom_ids, so the panel keeps working across restarts."""
+
+    def __init__(self, owner_id: int):
+        super().__init__(timeout=None)
+        for action in DraftButton.ACTIONS:
+            self.add_item(DraftButton(action, owner_id))
+        self.add_item(DraftRemindSelect(owner_id))
+
+
+class DraftButton(
+    OwnedItem,
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"hk:draft:(?P<action>cancel|date|time|finish):(?P<owner>\d+)",
+):
+    ACTIONS = {
+        "cancel": ("Cancel", discord.ButtonStyle.danger, "\N{CROSS MARK}"),
+        "date": ("Add Date", discord.ButtonStyle.primary, "\N{CALENDAR}"),
+        "time": ("Add Time", discord.ButtonStyle.primary, "\N{CLOCK FACE ONE OCLOCK}"),
+        "finish": (
+            "Finish",
+            discord.ButtonStyle.success,
+            "\N{WHITE HEAVY CHECK MARK}",
+        ),
+    }
+
+    def __init__(self, action: str, owner_id: int):
+        label, style, emoji = self.ACTIONS[action]
+        super().__init__(
+            discord.ui.Button(
+                label=label,
+                style=style,
+                emoji=emoji,
+                custom_id=f"hk:draft:{action}:{owner_id}",
+                row=0,
+            )
+        )
+        self.action = action
+        self.owner_id = owner_id
+
+    @classmethod
+    async def from_custom_id(
+        cls, itx: discord.Interaction, item: discord.ui.Button, match: re.Match[str]
+    ) -> "DraftButton":
+        return cls(match["action"], int(match["owner"]))
+
+    async def callback(self, itx: discord.Interaction) -> None:
+        if self.action == "cancel":
+            await edit_interaction_message(itx, view=disabled_view(itx.message))
+        elif self.action == "date":
+            await itx.response.send_modal(AddTaskDateModal(owner_id=self.owner_id))
+        elif self.action == "time":
+            await itx.response.send_modal(AddTaskTimeModal(owner_id=self.owner_id))
+        else:
+            await self.finish(itx)
 
-class AddTaskView(HuskyPanel):
-    @discord.ui.button(
-        label="Add Date", style=discord.ButtonStyle.primary, emoji="\N{CALENDAR}"
-    )
-    async def add_date(self, itx: discord.Interaction, button: discord.ui.Button):
-        # open a modal using the interaction
-        modal = AddTaskDateModal(self.ctx, self.embed)
-        await itx.response.send_modal(modal)
-
-    @discord.ui.button(
-        label="Add Time",
-        style=discord.ButtonStyle.primary,
-        emoji="\N{CLOCK FACE ONE OCLOCK}",
-    )
-    async def add_time(self, itx: discord.Interaction, button: discord.ui.Button):
-        modal = AddTaskTimeModal(self.ctx, self.embed)
-        await itx.response.send_modal(modal)
-
-    @discord.ui.button(
-        label="Finish",
-        style=discord.ButtonStyle.success,
-        emoji="\N{WHITE HEAVY CHECK MARK}",
-    )
-    async def finish(self, itx: discord.Interaction, button: discord.ui.Button):
-        embed_dict = self.embed.to_dict()
+    async def finish(self, itx: discord.Interaction) -> None:
+        embed_dict = itx.message.embeds[0].to_dict()
         cdate: datetime.date
         if embed_dict["fields"][0]["value"] == "Not Set":
             cdate = None
@@ -141,12 +168,16 @@ class AddTaskView(HuskyPanel):
 
         remind_type = embed_dict["fields"][2]["value"]
 
-        await self.ctx.bot.db_todo.new_todo(
+        # the task references the user's row. Free for known users; a user's
+        # first task waits for the next batched insert (up to `flush_delay`)
+        await itx.client.db_users.user_check(itx.user.id)
+        await itx.client.db_todo.new_todo(
             itx.user.id, embed_dict["description"], cdate, ctime, remind_type
         )
-        embed = self.ctx.embed(
+        embed = itx.client.embeds.build(
             title="\N{WHITE HEAVY CHECK MARK} Task Created",
             description=embed_dict["description"],
+            author=itx.user,
         )
 
         datetime_desc = None
@@ -162,29 +193,42 @@ class AddTaskView(HuskyPanel):
         if datetime_desc is not None:
             embed.add_field(name="Date & Time", value=datetime_desc)
 
-        await itx.response.edit_message(embed=embed, view=None)
+        await edit_interaction_message(itx, embed=embed, view=None)
+
+
+class DraftRemindSelect(
+    OwnedItem,
+    discord.ui.DynamicItem[discord.ui.Select],
+    template=r"hk:draft:remind:(?P<owner>\d+)",
+):
+    def __init__(self, owner_id: int):
+        super().__init__(
+            discord.ui.Select(
+                placeholder="Remind type",
+                options=[
+                    discord.SelectOption(label="Mention (this channel)"),
+                    discord.SelectOption(label="Direct Message"),
+                    discord.SelectOption(label="None"),
+                ],
+                custom_id=f"hk:draft:remind:{owner_id}",
+                row=1,
+            )
+        )
+        self.owner_id = owner_id
 
-    @discord.ui.select(
-        placeholder="Remind type",
-        options=[
-            discord.SelectOption(label="Mention (this channel)"),
-            discord.SelectOption(label="Direct Message"),
-            discord.SelectOption(label="None"),
-        ],
-    )
-    async def remind_type(self, itx: discord.Interaction, select: discord.ui.Select):
-        embed_dict = self.embed.to_dict()
-        embed_dict["fields"][2]["value"] = select.values[0]
-        self.embed = discord.Embed.from_dict(embed_dict)
-        await itx.response.edit_message(embed=self.embed)
+    @classmethod
+    async def from_custom_id(
+        cls, itx: discord.Interaction, item: discord.ui.Select, match: re.Match[str]
+    ) -> "DraftRemindSelect":
+        return cls(int(match["owner"]))
 
+    async def callback(self, itx: discord.Interaction) -> None:
+        embed_dict = itx.message.embeds[0].to_dict()
+        embed_dict["fields"][2]["value"] = self.item.values[0]
+        await edit_interaction_message(itx, embed=discord.Embed.from_dict(embed_dict))
 
-class AddTaskDateModal(HuskyModal, title="Add task date"):
-    def __init__(self, ctx: HuskyContext, embed: discord.Embed):
-        super().__init__(ctx)
-        self.ctx = ctx
-        self.embed = embed
 
+class AddTaskDateModal(HuskyModal, title="Add task date"):
     date = discord.ui.TextInput(
         label="Date",
         placeholder="October 20 ... 20/10/2021 ... 20-10-2021 ... 20.10.2021 ... tomorrow ... next week",
@@ -192,7 +236,7 @@ class AddTaskDateModal(HuskyModal, title="Add task date"):
 
     async def on_submit(self, itx: discord.Interaction) -> None:
         cdate = await convert_date(self.ctx, self.date.value)
-        embed_dict = self.embed.to_dict()
+        embed_dict = itx.message.embeds[0].to_dict()
         t = embed_dict["fields"][1]["value"]
         if t != "Not Set":
             ctime = datetime.datetime.strptime(t, "%I:%M %p").time()
@@ -211,35 +255,44 @@ class AddTaskDateModal(HuskyModal, title="Add task date"):
             return
 
         embed_dict["fields"][0]["value"] = cdate.strftime("%B %d, %Y")
-        self.embed = discord.Embed.from_dict(embed_dict)
-        await itx.response.edit_message(embed=self.embed)
+        await edit_interaction_message(itx, embed=discord.Embed.from_dict(embed_dict))
 
 
 class AddTaskTimeModal(HuskyModal, title="Add task time"):
-    def __init__(self, ctx: HuskyContext, embed: discord.Embed):
-        super().__init__(ctx)
-        self.ctx = ctx
-        self.embed = embed
-
     time = discord.ui.TextInput(
         label="Time",
         placeholder="10:00 AM ... 10:00 PM ... 10:00 ... 10:00:00",
     )
 
     async def on_submit(self, itx: discord.Interaction) -> None:
-        embed_dict = self.embed.to_dict()
+        embed_dict = itx.message.embeds[0].to_dict()
         conv = await convert_time(self.ctx, self.time.value)
         embed_dict["fields"][1]["value"] = conv.strftime("%I:%M %p")
-        self.embed = discord.Embed.from_dict(embed_dict)
-        await itx.response.edit_message(embed=self.embed)
+        await edit_interaction_message(itx, embed=discord.Embed.from_dict(embed_dict))
+
+
+class TaskPages(PersistentPaginator[Task], kind="tasks"):
+    """`todo list`. The key is `overdue` to only list overdue tasks."""
 
+    @cached_property
+    def overdue_before(self) -> datetime.datetime | None:
+        return datetime.datetime.now() if self.key == "overdue" else None
 
-class TaskPaginator(HuskyPaginator):
-    async def update_embed(
-        self, indicies: Indicies, current_content: list[Task]
-    ) -> discord.Embed:
-        embed = self.ctx.embed(title="\N{Memo} Your Tasks")
-        for i, task in enumerate(current_content):
+    async def fetch(self, offset: int, limit: int) -> list[Task]:
+        return await self.bot.db_todo.get_user_tasks_page(
+            self.owner.id, offset, limit, self.overdue_before
+        )
+
+    async def count(self) -> int:
+        return await self.bot.db_todo.count_user_tasks(
+            self.owner.id, self.overdue_before
+        )
+
+    async def render(self, indicies: Indicies, items: list[Task]) -> discord.Embed:
+        embed = self.bot.embeds.build(
+            title=f"\N{Memo} Your Tasks - Page `{self.page_label}`", author=self.owner
+        )
+        for i, task in enumerate(items):
             cdate = task.date
             ctime = task.time
             datetime_desc = None
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 import discord
 from discord.ext import commands
 from lxml import etree
@@ -9,7 +9,7 @@ from ..utils.errors import InternalError
 from ..utils.types import Indicies
 
 from ..cls_bot import Husky, HuskyContext, HuskyCog
-from ..cls_ext import HuskyPaginator
+from ..cls_ext import HuskyPaginator, HuskyStreamPaginator
 from ..utils.converters import URL_safe_param, optional_URL_safe_param
 from urllib.parse import unquote_plus
 
@@ -51,19 +51,18 @@ class Web(HuskyCog):
             )
 
         base = "https://lite.duckduckgo.com/lite"
-        response = await self.bot.session.post(
-            base,
-            data={
-                "q": query,
-            },
-        )
-
-        root = etree.fromstring(await response.text(), etree.HTMLParser())
+        with ctx.span("fetch"):
+            response = await self.bot.web_client.post(
+                base,
+                data={
+                    "q": query,
+                },
+            )
+            text = response.text()
 
-        results: list[tuple[str, str, str]] = []
-        minor: list[str, str, str] = [None, None, None]
+        with ctx.span("parse"):
+            root = etree.fromstring(text, etree.HTMLParser())
 
-        n = 0  # xpaths is 1-indexed
         xpath_base = "/html/body/form/div/table[3]/tr[{}]"
 
         def format_text(text: str) -> str:
@@ -83,35 +82,38 @@ class Web(HuskyCog):
             except AttributeError:
                 return "<no text provided>"
 
-        while True:
-            xpath_base_fmt = xpath_base.format(n + 1)
-            try:
-                if n % 4 == 0:
-                    xpath = xpath_base_fmt + "/td[2]/a"
-                    minor[0] = format_text(root.xpath(xpath)[0].text)
-                elif n % 4 == 1:
-                    xpath = xpath_base_fmt + "/td[2]"
-                    temp = ""
-                    for child in root.xpath(xpath)[0].itertext():
-                        temp += child
-                    minor[1] = format_text(temp)
-                elif n % 4 == 2:
-                    xpath = xpath_base_fmt + "/td[2]/span[1]"
-                    minor[2] = format_text(root.xpath(xpath)[0].text)
-                else:  # n % 4 == 3, blank spacer
-                    xpath = xpath_base_fmt + "/td[2]"
-                    results.append(tuple(minor))
-                    minor = [None, None, None]
-
-            except IndexError:
-                break
+        async def results() -> AsyncIterator[tuple[str, str, str]]:
+            # rows are only parsed as the paginator asks for them
+            minor: list[str, str, str] = [None, None, None]
+            n = 0  # xpaths is 1-indexed
+            while True:
+                xpath_base_fmt = xpath_base.format(n + 1)
+                try:
+                    if n % 4 == 0:
+                        xpath = xpath_base_fmt + "/td[2]/a"
+                        minor[0] = format_text(root.xpath(xpath)[0].text)
+                    elif n % 4 == 1:
+                        xpath = xpath_base_fmt + "/td[2]"
+                        temp = ""
+                        for child in root.xpath(xpath)[0].itertext():
+                            temp += child
+                        minor[1] = format_text(temp)
+                    elif n % 4 == 2:
+                        xpath = xpath_base_fmt + "/td[2]/span[1]"
+                        minor[2] = format_text(root.xpath(xpath)[0].text)
+                    else:  # n % 4 == 3, blank spacer
+                        xpath = xpath_base_fmt + "/td[2]"
+                        yield tuple(minor)
+                        minor = [None, None, None]
+
+                except IndexError:
+                    break
+
+                n += 1
 
-            n += 1
-
-        response.close()
         paginator = WebSearchPaginator(
             ctx,
-            results,
+            results(),
             5,
             extras={
                 "query": unquote_plus(query),
@@ -141,13 +143,14 @@ class Web(HuskyCog):
             )
 
         base = "https://unsplash.com/s/photos"
-        response = await self.bot.session.get(
-            f"{base}/{query.replace('+', '-')}",
-        )
-
-        root = etree.fromstring(await response.text(), etree.HTMLParser())
+        with ctx.span("fetch"):
+            response = await self.bot.web_client.get(
+                f"{base}/{query.replace('+', '-')}",
+            )
+            text = response.text()
 
-        response.close()
+        with ctx.span("parse"):
+            root = etree.fromstring(text, etree.HTMLParser())
 
         results: list[tuple[str, str]] = []
         for c in root.xpath("//img[@itemprop='thumbnailUrl']"):
@@ -156,8 +159,6 @@ class Web(HuskyCog):
             except KeyError:
                 break
 
-        response.close()
-
         paginator = WebImagePaginator(
             ctx,
             results,
@@ -172,14 +173,11 @@ class Web(HuskyCog):
         await paginator.start(message)
 
 
-class WebSearchPaginator(HuskyPaginator):
+class WebSearchPaginator(HuskyStreamPaginator):
     async def update_embed(
         self, indicies: Indicies, current_content: list
     ) -> discord.Embed:
-        embed = self.ctx.embed(
-            title=f"Search Results for `{self.extras['query']}` via DuckDuckGo - Page `{self.page + 1}/{self.n_pages}`",
-            description=f"{len(self.items)} results in `~{self.extras['fetch_time']}` seconds",
-        )
+        embed = self.ctx.embed()
         for i, result in enumerate(current_content):
             embed.add_field(
                 name=f"`{indicies.start+i+1}.` {result[0]}",
@@ -189,13 +187,17 @@ class WebSearchPaginator(HuskyPaginator):
 
         return embed
 
+    def update_header(self, embed: discord.Embed) -> None:
+        embed.title = f"Search Results for `{self.extras['query']}` via DuckDuckGo - Page `{self.page_label}`"
+        embed.description = f"{len(self.items)}{'' if self.exhausted else '+'} results in `~{self.extras['fetch_time']}` seconds"
+
 
 class WebImagePaginator(HuskyPaginator):
     async def update_embed(
         self, indicies: Indicies, current_content: list
     ) -> discord.Embed:
         embed = self.ctx.embed(
-            title=f"Image Results for `{self.extras['query']}` via UnSplash - Page `{self.page + 1}/{self.n_pages}`",
+            title=f"Image Results for `{self.extras['query']}` via UnSplash - Page `{self.page_label}`",
             description=f"{len(self.items)} results in `~{self.extras['fetch_time']}` seconds",
         )
         current_content = current_content[0]
@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import multiprocessing
+import queue
+import time
+from dataclasses import dataclass, field
+from multiprocessing.process import BaseProcess
+from typing import Any, Optional
+
+from . import logging_setup
+from .utils.config import loop_factory
+
+
+HEALTH_INTERVAL = 15
+"""How often each worker reports its health to the supervisor, in seconds."""
+SUMMARY_INTERVAL = 60
+"""How often the supervisor logs the aggregated health of all workers, in seconds."""
+STABLE_AFTER = 120
+"""A worker that stays up this long has its restart backoff reset, in seconds."""
+MAX_BACKOFF = 60
+
+
+def shard_ranges(shard_count: int, processes: int) -> list[list[int]]:
+    """Splits `range(shard_count)` into `processes` contiguous, near-equal ranges."""
+    processes = min(processes, shard_count)
+    size, extra = divmod(shard_count, processes)
+    ranges = []
+    start = 0
+    for i in range(processes):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+def run_worker(
+    index: int,
+    shard_ids: list[int],
+    shard_count: int,
+    env: dict[str, Any],
+    health: multiprocessing.Queue,
+) -> None:
+    """Entry point of a worker process."""
+    factory = loop_factory(env.get("runtime", {}).get("loop"))
+    with asyncio.Runner(loop_factory=factory) as runner:
+        runner.run(_worker_main(index, shard_ids, shard_count, env, health))
+
+
+async def _worker_main(
+    index: int,
+    shard_ids: list[int],
+    shard_count: int,
+    env: dict[str, Any],
+    health: multiprocessing.Queue,
+) -> None:
+    from .cls_bot import ShardedHusky
+
+    # only the first worker runs process-wide singletons such as the reminder loop
+    husky = ShardedHusky(
+        env=env, shard_ids=shard_ids, shard_count=shard_count, primary=index == 0
+    )
+    async with husky:
+        reporter = asyncio.create_task(_report_health(husky, index, health))
+        try:
+            await husky.start(env["discord"]["token"])
+        finally:
+            reporter.cancel()
+
+
+async def _report_health(husky, index: int, health: multiprocessing.Queue) -> None:
+    while True:
+        latencies = dict(husky.latencies) if husky.is_ready() else {}
+        health.put_nowait(
+            {
+                "worker": index,
+                "shards": husky.shard_ids,
+                "ready": husky.is_ready(),
+                "guilds": len(husky.guilds),
+                "latency": max(latencies.values(), default=None),
+                "time": time.time(),
+            }
+        )
+        await asyncio.sleep(HEALTH_INTERVAL)
+
+
+@dataclass
+class Worker:
+    index: int
+    shard_ids: list[int]
+    process: Optional[BaseProcess] = None
+    started: float = 0.0
+    restarts: int = 0
+    backoff: float = 1.0
+    restart_at: Optional[float] = None
+    health: dict[str, Any] = field(default_factory=dict)
+
+
+class Supervisor:
+    """Runs `Husky` across several worker processes, each owning a contiguous range
+    of shards. Crashed workers are restarted with exponential backoff and the health
+    reported by each worker is aggregated into a periodic log line."""
+
+    def __init__(self, env: dict[str, Any], shard_count: int, processes: int):
+        self.env = env
+        self.shard_count = shard_count
+        self.mp = multiprocessing.get_context("spawn")
+        self.health_queue: multiprocessing.Queue = self.mp.Queue()
+        self.workers = [
+            Worker(i, shard_ids)
+            for i, shard_ids in enumerate(shard_ranges(shard_count, processes))
+        ]
+        self.stopping = False
+
+    def spawn(self, worker: Worker) -> None:
+        worker.process = self.mp.Process(
+            target=run_worker,
+            args=(
+                worker.index,
+                worker.shard_ids,
+                self.shard_count,
+                self.env,
+                self.health_queue,
+            ),
+            name=f"husky-worker-{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.started = time.monotonic()
+        worker.restart_at = None
+        logging.info(
+            f"started worker {worker.index} (pid {worker.process.pid}) for shards {worker.shard_ids}"
+        )
+
+    def check(self, worker: Worker) -> None:
+        now = time.monotonic()
+        if worker.restart_at is not None:
+            if now >= worker.restart_at:
+                worker.restarts += 1
+                self.spawn(worker)
+            return
+
+        if worker.process.is_alive():
+            if now - worker.started > STABLE_AFTER:
+                worker.backoff = 1.0
+            return
+
+        logging.warning(
+            f"worker {worker.index} exited with code {worker.process.exitcode}, restarting in {worker.backoff:.0f}s"
+        )
+        worker.health = {}
+        worker.restart_at = now + worker.backoff
+        worker.backoff = min(worker.backoff * 2, MAX_BACKOFF)
+
+    def drain_health(self) -> None:
+        while True:
+            try:
+                report = self.health_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.workers[report["worker"]].health = report
+
+    def summary(self) -> str:
+        parts = []
+        for w in self.workers:
+            h = w.health
+            if not h:
+                state = "down" if w.restart_at is not None else "starting"
+            else:
+                latency = (
+                    f"{h['latency'] * 1000:.0f}ms" if h["latency"] is not None else "-"
+                )
+                state = f"{'ready' if h['ready'] else 'connecting'} guilds={h['guilds']} latency={latency}"
+            parts.append(
+                f"[{w.index} shards {w.shard_ids[0]}-{w.shard_ids[-1]} restarts={w.restarts}: {state}]"
+            )
+        return " ".join(parts)
+
+    def run(self) -> None:
+        logging_setup.begin()
+        logging.info(
+            f"supervising {len(self.workers)} workers over {self.shard_count} shards"
+        )
+        for worker in self.workers:
+            self.spawn(worker)
+
+        last_summary = time.monotonic()
+        try:
+            while not self.stopping:
+                time.sleep(1)
+                self.drain_health()
+                for worker in self.workers:
+                    self.check(worker)
+
+                if time.monotonic() - last_summary >= SUMMARY_INTERVAL:
+                    logging.info(f"health: {self.summary()}")
+                    last_summary = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        self.stopping = True
+        for worker in self.workers:
+            if worker.process is not None and worker.process.is_alive():
+                worker.process.terminate()
+        for worker in self.workers:
+            if worker.process is not None:
+                worker.process.join(timeout=10)
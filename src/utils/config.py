@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from typing import Any, Callable, Optional
+import discord
+
+
+def build_intents(value: str | list[str] | None) -> discord.Intents:
+    """`"all"`, `"default"`, or a list of `discord.Intents` flag names. Defaults to all intents."""
+    if value is None or value == "all":
+        return discord.Intents.all()
+    if value == "default":
+        return discord.Intents.default()
+    if isinstance(value, str):
+        raise ValueError(f"Unknown intents preset: {value}")
+
+    intents = discord.Intents.none()
+    for name in value:
+        if name not in discord.Intents.VALID_FLAGS:
+            raise ValueError(f"Unknown intent: {name}")
+        setattr(intents, name, True)
+    return intents
+
+
+def build_member_cache_flags(
+    value: str | list[str] | None, intents: discord.Intents
+) -> discord.MemberCacheFlags:
+    """`"all"`, `"none"`, or a list of `discord.MemberCacheFlags` flag names. Defaults to what `intents` allow."""
+    if value is None:
+        return discord.MemberCacheFlags.from_intents(intents)
+    if value == "all":
+        return discord.MemberCacheFlags.all()
+    if value == "none":
+        return discord.MemberCacheFlags.none()
+    if isinstance(value, str):
+        raise ValueError(f"Unknown member cache preset: {value}")
+
+    flags = discord.MemberCacheFlags.none()
+    for name in value:
+        if name not in discord.MemberCacheFlags.VALID_FLAGS:
+            raise ValueError(f"Unknown member cache flag: {name}")
+        setattr(flags, name, True)
+    return flags
+
+
+def client_options(env: dict[str, Any]) -> dict[str, Any]:
+    """Builds the intents/cache keyword arguments for `discord.Client` from the
+    `cache` section of `env.json`. Missing keys keep discord.py's defaults, except
+    for intents, which default to all."""
+    cfg = env.get("cache", {})
+    intents = build_intents(cfg.get("intents"))
+    options: dict[str, Any] = {
+        "intents": intents,
+        "member_cache_flags": build_member_cache_flags(
+            cfg.get("member_cache"), intents
+        ),
+    }
+    if "max_messages" in cfg:
+        options["max_messages"] = cfg["max_messages"]
+    if "chunk_guilds_at_startup" in cfg:
+        options["chunk_guilds_at_startup"] = cfg["chunk_guilds_at_startup"]
+    return options
+
+
+LOOPS = ("asyncio", "uvloop")
+
+
+def loop_factory(
+    name: Optional[str],
+) -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """The event loop factory for `asyncio.Runner`: `"asyncio"` (the default) or
+    `"uvloop"`. Falls back to asyncio, with a warning, if uvloop isn't installed."""
+    if name is None or name == "asyncio":
+        return None
+    if name != "uvloop":
+        raise ValueError(f"Unknown event loop: {name}")
+    try:
+        import uvloop
+    except ImportError:
+        logging.warning("uvloop is not installed; using the asyncio event loop")
+        return None
+    return uvloop.new_event_loop
@@ -1,7 +1,7 @@
 import datetime
 from functools import reduce
 import time
-from typing import Annotated, Any, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Optional
 import discord
 from discord.ext import commands
 from urllib.parse import quote_plus
@@ -9,9 +9,12 @@ from urllib.parse import quote_plus
 from ..cls_bot import Husky, HuskyContext
 from .types import Color
 from .errors import InvalidMediaFormat, InvalidMediaSize
+from .tracing import span
 import re
 
-from wand.image import Image as WandImage
+if TYPE_CHECKING:
+    # wand loads ImageMagick, so it is only imported once an image is converted
+    from wand.image import Image as WandImage
 
 
 class HuskyConverter(commands.Converter):
@@ -252,14 +255,18 @@ MAX_IMAGE_SIZE_BYTES = 8_388_608  # 8 MB
 MAX_VIDEO_SIZE_BYTES = 16_777_216  # 16 MB
 
 
-async def convert_image(attachment: discord.Attachment) -> WandImage:
+async def convert_image(attachment: discord.Attachment) -> "WandImage":
+    from wand.image import Image as WandImage
+
     if attachment.size > MAX_IMAGE_SIZE_BYTES:
         raise InvalidMediaSize("Image is too large.")
     if (dot := attachment.filename.rfind(".")) != -1:
         if attachment.filename[dot + 1 :].lower() in VALID_IMAGE_FORMATS:
-            data = await attachment.read()
+            with span("download"):
+                data = await attachment.read()
             try:
-                return WandImage(blob=data)
+                with span("decode"):
+                    return WandImage(blob=data)
             except Exception as e:
                 raise InvalidMediaFormat(
                     f"Could not convert image (most likely format mismatch): {e}"
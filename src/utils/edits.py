@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+import discord
+
+
+class EditScheduler:
+    """Coalesces message edits. Edits scheduled for the same message are merged
+    (later keyword arguments win) and sent once `debounce` seconds after the
+    first of them, so a burst of button presses costs one request instead of
+    one per press. Edits made while another is in flight are sent after it, in
+    order."""
+
+    def __init__(self, debounce: float = 0.25):
+        self.debounce = debounce
+        self._pending: dict[
+            int, tuple[Callable[..., Awaitable[Any]], dict[str, Any]]
+        ] = {}
+        self._tasks: dict[int, asyncio.Task] = {}
+
+    def schedule(
+        self, message_id: int, edit: Callable[..., Awaitable[Any]], **kwargs: Any
+    ) -> None:
+        """Queues `edit(**kwargs)` for `message_id`. If an edit is already queued,
+        `edit` replaces its callable (e.g. with a fresher interaction's
+        `edit_original_response`) and `kwargs` are merged into it."""
+        pending = self._pending.get(message_id)
+        if pending is None:
+            self._pending[message_id] = (edit, kwargs)
+        else:
+            self._pending[message_id] = (edit, {**pending[1], **kwargs})
+
+        if message_id not in self._tasks:
+            self._tasks[message_id] = asyncio.create_task(self._drain(message_id))
+
+    def cancel(self, message_id: int) -> None:
+        """Drops any queued edit, e.g. because the message is being deleted."""
+        self._pending.pop(message_id, None)
+        task = self._tasks.pop(message_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def _drain(self, message_id: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.debounce)
+                pending = self._pending.pop(message_id, None)
+                if pending is None:
+                    return
+                edit, kwargs = pending
+                try:
+                    await edit(**kwargs)
+                except discord.HTTPException as e:
+                    logging.warning(
+                        f"coalesced edit of message {message_id} failed: {e}"
+                    )
+        finally:
+            if self._tasks.get(message_id) is asyncio.current_task():
+                del self._tasks[message_id]
@@ -0,0 +1,104 @@
+import datetime
+from typing import Optional, Union
+import discord
+
+DEFAULT_COLOR = discord.Color.dark_teal()
+
+
+class EmbedTemplate:
+    """A finished embed to make many copies of. `copy` is `Embed.copy` without the
+    round trip through `to_dict`/`from_dict`, which costs more than building the
+    embed again. Changes to `embed` after the template is made aren't copied."""
+
+    __slots__ = ("embed", "_state")
+
+    def __init__(self, embed: discord.Embed):
+        self.embed = embed
+        self._state = [
+            (slot, getattr(embed, slot))
+            for slot in discord.Embed.__slots__
+            if hasattr(embed, slot)
+        ]
+
+    def copy(self) -> discord.Embed:
+        embed = discord.Embed.__new__(discord.Embed)
+        for slot, value in self._state:
+            # footer, author and fields are copied so the copy can be changed freely
+            if isinstance(value, dict):
+                value = dict(value)
+            elif isinstance(value, list):
+                value = [dict(field) for field in value]
+            setattr(embed, slot, value)
+        return embed
+
+
+class EmbedFactory:
+    """Builds the standard Husky embed: colour, timestamp, author block and a
+    `husky @ <time> ~ <prefix>help` footer. A base embed with the colour and footer
+    is built once per colour per minute and author blocks once per user per
+    minute; each `build` copies the base and only sets what differs per call."""
+
+    FOOTER_FORMAT = "%B %d, %Y at %H:%M"
+
+    def __init__(self, prefix: str, color: discord.Color = DEFAULT_COLOR):
+        self.prefix = prefix
+        self.color = color
+        self._minute: Optional[datetime.datetime] = None
+        self._footer = ""
+        self._bases: dict[int, EmbedTemplate] = {}
+        """Colour value -> embed with that colour and the current footer."""
+        self._authors: dict[tuple[int, str, str], dict[str, str]] = {}
+        """(user id, display name, avatar hash) -> `set_author` kwargs. Cleared
+        every minute, which bounds its size."""
+
+    def footer(self, now: datetime.datetime) -> str:
+        minute = now.replace(second=0, microsecond=0)
+        if minute != self._minute:
+            self._minute = minute
+            local = minute.astimezone().strftime(self.FOOTER_FORMAT)
+            self._footer = f"husky @ {local} ~ {self.prefix}help"
+            self._bases.clear()
+            self._authors.clear()
+        return self._footer
+
+    def base(self, color: discord.Color, now: datetime.datetime) -> EmbedTemplate:
+        footer = self.footer(now)
+        base = self._bases.get(color.value)
+        if base is None:
+            embed = discord.Embed(color=color)
+            embed.set_footer(text=footer)
+            base = self._bases[color.value] = EmbedTemplate(embed)
+        return base
+
+    def author(self, user: Union[discord.User, discord.Member]) -> dict[str, str]:
+        avatar = user.display_avatar
+        key = (user.id, user.display_name, avatar.key)
+        block = self._authors.get(key)
+        if block is None:
+            block = self._authors[key] = {
+                "name": user.display_name,
+                "url": f"https://discordapp.com/users/{user.id}",
+                "icon_url": avatar.url,
+            }
+        return block
+
+    def build(
+        self,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        color: Optional[discord.Color] = None,
+        author: Optional[Union[discord.User, discord.Member]] = None,
+        **kwargs,
+    ) -> discord.Embed:
+        """`kwargs` are any other `discord.Embed` arguments, e.g. `url`."""
+        # aware, so `Embed.timestamp` doesn't have to look up the local timezone
+        now = discord.utils.utcnow()
+        embed = self.base(color or self.color, now).copy()
+        embed.title = title
+        embed.description = description
+        embed.timestamp = now
+        for name, value in kwargs.items():
+            setattr(embed, name, value)
+        if author is not None:
+            embed.set_author(**self.author(author))
+        return embed
@@ -21,9 +21,14 @@ class InvalidMediaSize(HuskyError):
     """The size of your attachment was too big."""
 
 
+class ResponseTooLarge(HuskyError):
+    """The website sent back more data than I'm willing to read."""
+
+
 class AmbiguousCommandName(HuskyError):
-    def __init__(self, found_commands: list[commands.Command]):
+    def __init__(self, found_commands: list[commands.Command], name: str = ""):
         self.found_commands = found_commands
+        self.name = name
 
     """The command you called does not exist, so I tried to find a
     command that was similar to the one you called. However, I found
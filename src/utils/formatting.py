@@ -1,27 +1,32 @@
 import discord
-from typing import Any
-from wand.image import Image as WandImage
+from typing import TYPE_CHECKING, Any
 
 from io import BytesIO
 from ..cls_bot import HuskyContext
 
-from fuzzywuzzy import fuzz
+if TYPE_CHECKING:
+    from wand.image import Image as WandImage
 
 
 def fmt_data(d: list[tuple[str, str]]) -> str:
     return "\n".join(f"**{k}:** `{v}`" for k, v in d)
 
 
-async def sendoff(ctx: HuskyContext, image: WandImage, title: str = None):
-    image.format = "png"
-    image_buffer = BytesIO()
-    image.save(file=image_buffer)
-    image_buffer.seek(0)
+async def sendoff(ctx: HuskyContext, image: "WandImage", title: str = None):
+    with ctx.span("encode"):
+        image.format = "png"
+        image_buffer = BytesIO()
+        image.save(file=image_buffer)
+        image_buffer.seek(0)
     file = discord.File(image_buffer, filename="image.png")
     embed = ctx.embed(title=title)
     embed.set_image(url="attachment://image.png")
-    await ctx.send(embed=embed, file=file)
+    with ctx.span("upload"):
+        await ctx.send(embed=embed, file=file)
 
 
 def fuzzy(source: str, match: str) -> float:
+    # deferred until the first autocomplete
+    from fuzzywuzzy import fuzz
+
     return float(fuzz.ratio(source, match)) / 100
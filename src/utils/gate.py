@@ -0,0 +1,34 @@
+from collections import Counter
+import discord
+
+
+class MessageGate:
+    """Cheap admission check run on every incoming message before any context is
+    built. Only messages that could plausibly be commands are let through; the rest
+    are counted by rejection reason."""
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        """Matched case-sensitively, like `commands.Bot.command_prefix`."""
+        self.admitted = 0
+        """Messages that passed the gate."""
+        self.rejected: Counter[str] = Counter()
+        """Rejected messages, keyed by reason (`bot`, `webhook`, `prefix`)."""
+
+    def admit(self, message: discord.Message) -> bool:
+        if message.author.bot:
+            self.rejected["bot"] += 1
+            return False
+        if message.webhook_id is not None:
+            self.rejected["webhook"] += 1
+            return False
+        if not message.content.startswith(self.prefix):
+            self.rejected["prefix"] += 1
+            return False
+
+        self.admitted += 1
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """Messages seen per outcome, admitted first. Shown by `dev gate`."""
+        return {"admitted": self.admitted, **self.rejected}
@@ -0,0 +1,149 @@
+import codecs
+import logging
+from time import perf_counter
+from typing import Any, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+from multidict import CIMultiDictProxy
+from yarl import URL
+
+from .errors import ResponseTooLarge
+from .tracing import LatencyHistogram
+
+try:
+    import brotli  # noqa: F401 (aiohttp decodes br itself when this is installed)
+except ImportError:
+    brotli = None
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0"
+)
+
+
+class HostStats:
+    __slots__ = ("requests", "errors", "bytes", "latency")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        """Requests that raised, timed out or were cut off at the size cap."""
+        self.bytes = 0
+        """Decompressed body bytes read."""
+        self.latency = LatencyHistogram()
+        """Time from sending the request to having read the whole body."""
+
+
+class HTTPResponse(NamedTuple):
+    status: int
+    url: URL
+    headers: CIMultiDictProxy[str]
+    body: bytes
+    charset: Optional[str]
+
+    def text(self, errors: str = "replace") -> str:
+        encoding = self.charset or "utf-8"
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = "utf-8"
+        return self.body.decode(encoding, errors)
+
+
+class HuskyHTTP:
+    """The bot's shared HTTP client. Owns a single `aiohttp.ClientSession`, created
+    on first use (so always inside the running loop) and closed by `Husky.close`.
+    Bodies are read in full but streamed against `max_body_bytes` so an oversized
+    response is abandoned early instead of being buffered."""
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        keepalive_timeout: float = 30,
+        dns_cache_ttl: int = 300,
+        timeout: float = 15,
+        max_body_bytes: int = 5 * 1024 * 1024,
+        headers: Optional[dict[str, str]] = None,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self.max_body_bytes = max_body_bytes
+        self.headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, deflate, br" if brotli else "gzip, deflate",
+            **(headers or {}),
+        }
+        self.hosts: dict[str, HostStats] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                auto_decompress=True,
+            )
+        return self._session
+
+    async def request(
+        self, method: str, url: str, *, max_body_bytes: Optional[int] = None, **kwargs
+    ) -> HTTPResponse:
+        """Sends a request and reads the body, raising `ResponseTooLarge` as soon as
+        the declared or received size exceeds `max_body_bytes`."""
+        limit = max_body_bytes or self.max_body_bytes
+        stats = self.hosts.get(host := urlsplit(url).hostname or "")
+        if stats is None:
+            stats = self.hosts[host] = HostStats()
+        stats.requests += 1
+
+        start = perf_counter()
+        try:
+            async with self.session.request(method, url, **kwargs) as response:
+                if (response.content_length or 0) > limit:
+                    raise ResponseTooLarge(
+                        f"{host} sent {response.content_length} bytes (limit {limit})."
+                    )
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body += chunk
+                    if len(body) > limit:
+                        raise ResponseTooLarge(f"{host} sent more than {limit} bytes.")
+                result = HTTPResponse(
+                    response.status,
+                    response.url,
+                    response.headers,
+                    bytes(body),
+                    response.charset,
+                )
+        except Exception:
+            # cancellation isn't the host's fault, so it isn't counted as an error
+            stats.errors += 1
+            raise
+        stats.bytes += len(result.body)
+        stats.latency.record(perf_counter() - start)
+        return result
+
+    async def get(self, url: str, **kwargs: Any) -> HTTPResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> HTTPResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logging.info("closed HTTP session")
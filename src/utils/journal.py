@@ -0,0 +1,105 @@
+import copy
+import datetime
+from collections import OrderedDict, deque
+from typing import Any, NamedTuple
+import discord
+from discord.ext import commands
+
+
+class JournalEntry(NamedTuple):
+    user_id: int
+    channel_id: int
+    command: str
+    """The command's `qualified_name`."""
+    content: str
+    """Message content that re-runs the command."""
+    args: str
+    """`repr` of the converted arguments, for display only."""
+    attachments: list[dict[str, Any]]
+    """Raw attachment payloads, enough to rebuild `discord.Attachment`s."""
+    timestamp: datetime.datetime
+
+
+class CommandJournal:
+    """Bounded in-memory history of the commands each user ran, most recent last.
+    Filled from `Husky.on_command_completion`; commands with
+    `extras={"journal": False}` are not recorded."""
+
+    def __init__(
+        self, per_user: int = 50, max_users: int = 10_000, persist: bool = False
+    ):
+        self.per_user = per_user
+        self.max_users = max_users
+        self.persist = persist
+        """Whether entries are also queued for `drain` (and so for Postgres)."""
+        self.entries: OrderedDict[int, deque[JournalEntry]] = OrderedDict()
+        self.pending: list[JournalEntry] = []
+
+    def record(self, ctx: commands.Context) -> None:
+        if ctx.command is None or not ctx.command.extras.get("journal", True):
+            return
+
+        if ctx.interaction is None:
+            content = ctx.message.content
+        else:
+            # slash invocations have no message content, so rebuild a prefix invocation
+            values = [
+                str(v)
+                for v in ctx.kwargs.values()
+                if not isinstance(v, discord.Attachment)
+            ]
+            content = f"{ctx.bot.prefix}{ctx.command.qualified_name} {' '.join(values)}".strip()
+
+        attachments = [a.to_dict() for a in ctx.message.attachments]
+        for value in ctx.kwargs.values():
+            if (
+                isinstance(value, discord.Attachment)
+                and value not in ctx.message.attachments
+            ):
+                attachments.append(value.to_dict())
+
+        args = ", ".join(
+            [repr(a) for a in ctx.args[2:]]
+            + [f"{k}={v!r}" for k, v in ctx.kwargs.items()]
+        )
+        entry = JournalEntry(
+            user_id=ctx.author.id,
+            channel_id=ctx.channel.id,
+            command=ctx.command.qualified_name,
+            content=content,
+            args=args[:256],
+            attachments=attachments,
+            timestamp=datetime.datetime.now(),
+        )
+
+        history = self.entries.get(entry.user_id)
+        if history is None:
+            history = self.entries[entry.user_id] = deque(maxlen=self.per_user)
+            if len(self.entries) > self.max_users:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(entry.user_id)
+        history.append(entry)
+
+        if self.persist:
+            self.pending.append(entry)
+
+    def last(self, user_id: int, n: int = 1) -> list[JournalEntry]:
+        """The user's last `n` commands, oldest first."""
+        history = self.entries.get(user_id, ())
+        return list(history)[-n:] if n > 0 else []
+
+    def drain(self) -> list[JournalEntry]:
+        pending, self.pending = self.pending, []
+        return pending
+
+
+def replay_message(message: discord.Message, entry: JournalEntry) -> discord.Message:
+    """Returns a copy of `message` (so author, channel and state are those of the
+    current invocation) carrying the content and attachments of `entry`."""
+    replay = copy.copy(message)
+    replay.content = entry.content
+    replay.attachments = [
+        discord.Attachment(data=a, state=message._state) for a in entry.attachments
+    ]
+    return replay
@@ -0,0 +1,127 @@
+import ast
+from pathlib import Path
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+from discord.ext import commands
+
+GROUP_DECORATORS = {"group", "hybrid_group"}
+HYBRID_DECORATORS = {"hybrid_command", "hybrid_group"}
+COMMAND_DECORATORS = {"command", "group"} | HYBRID_DECORATORS
+
+
+class CommandStub(NamedTuple):
+    name: str
+    aliases: list[str]
+    parent: Optional[str]
+    """Name of the parent group, if this is a subcommand."""
+    is_group: bool
+    is_hybrid: bool
+    """Whether this is also an application command."""
+    description: str
+
+
+class ExtensionManifest(NamedTuple):
+    extension: str
+    """Dotted module path, e.g. `src.ext.image`."""
+    cog: str
+    description: str
+    commands: list[CommandStub]
+
+
+def scan_extension(path: Path, extension: str) -> ExtensionManifest:
+    """Reads the cog and command names of an extension from its source, without
+    importing it (or anything it imports)."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and any(
+            isinstance(b, ast.Name) and b.id == "HuskyCog" for b in node.bases
+        ):
+            return _scan_cog(node, extension)
+    raise ValueError(f"No HuskyCog found in {path}")
+
+
+def _scan_cog(node: ast.ClassDef, extension: str) -> ExtensionManifest:
+    cog_name = node.name
+    for kw in node.keywords:
+        if kw.arg == "name":
+            cog_name = ast.literal_eval(kw.value)
+
+    stubs: list[CommandStub] = []
+    groups: dict[str, str] = {}  # function name -> command name
+    for func in node.body:
+        if not isinstance(func, ast.AsyncFunctionDef):
+            continue
+        for deco in func.decorator_list:
+            if not (
+                isinstance(deco, ast.Call)
+                and isinstance(deco.func, ast.Attribute)
+                and deco.func.attr in COMMAND_DECORATORS
+                and isinstance(deco.func.value, ast.Name)
+            ):
+                continue
+
+            owner = deco.func.value.id
+            if owner != "commands" and owner not in groups:
+                continue
+            kwargs = {
+                kw.arg: ast.literal_eval(kw.value)
+                for kw in deco.keywords
+                if kw.arg in ("name", "aliases")
+            }
+            name = kwargs.get("name", func.name)
+            is_group = deco.func.attr in GROUP_DECORATORS
+            if is_group:
+                groups[func.name] = name
+            stubs.append(
+                CommandStub(
+                    name=name,
+                    aliases=list(kwargs.get("aliases", [])),
+                    parent=groups.get(owner),
+                    is_group=is_group,
+                    is_hybrid=deco.func.attr in HYBRID_DECORATORS,
+                    description=(ast.get_docstring(func) or "").split("\n")[0],
+                )
+            )
+            break
+
+    return ExtensionManifest(extension, cog_name, ast.get_docstring(node) or "", stubs)
+
+
+def build_stub_cog(
+    manifest: ExtensionManifest,
+    base: type[commands.Cog],
+    materialize: Callable[[Any, commands.Context], Awaitable[None]],
+) -> type[commands.Cog]:
+    """Creates a cog class with the same name and command tree as the extension
+    described by `manifest`, where every command calls `materialize(cog, ctx)`
+    instead of doing any work. Only prefix commands are stubbed; application
+    commands are materialized through `HuskyTree.interaction_check`."""
+
+    async def callback(self, ctx: commands.Context, *, args: str = ""):
+        await materialize(self, ctx)
+
+    attrs: dict[str, Any] = {"__doc__": manifest.description}
+    groups: dict[str, commands.Group] = {}
+    for stub in manifest.commands:
+        # `parent` has to be passed in the constructor (as `Group.command` does),
+        # otherwise the copies made when the cog is instantiated lose it
+        parent = groups[stub.parent] if stub.parent is not None else None
+        kwargs = dict(
+            name=stub.name,
+            aliases=stub.aliases,
+            description=stub.description,
+            parent=parent,
+            # the real command records the invocation once it's re-dispatched
+            extras={"journal": False, "trace": False},
+        )
+        if stub.is_group:
+            command = commands.Group(callback, invoke_without_command=True, **kwargs)
+            groups[stub.name] = command
+        else:
+            command = commands.Command(callback, **kwargs)
+
+        if parent is not None:
+            parent.add_command(command)
+        key = stub.name if stub.parent is None else f"{stub.parent}_{stub.name}"
+        attrs[f"stub_{key}"] = command
+
+    return type(f"Lazy{manifest.cog}", (base,), attrs, name=manifest.cog)
@@ -0,0 +1,144 @@
+from collections import Counter
+from typing import Iterable
+from discord.ext import commands
+
+
+def trigrams(name: str) -> set[str]:
+    padded = f"  {name.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class CommandIndex:
+    """Maps every qualified-name suffix and alias of a command to the commands it
+    resolves to, so a partial command name can be resolved with a single dictionary
+    lookup instead of a scan over `Husky.walk_commands()`. A trigram index over the
+    same names backs the "did you mean" suggestions.
+
+    Kept up to date incrementally by `Husky.add_cog`/`Husky.remove_cog` and rebuilt
+    after `Husky.reload_extensions`."""
+
+    def __init__(self) -> None:
+        self._index: dict[str, list[commands.Command]] = {}
+        self._keys: dict[commands.Command, set[str]] = {}
+
+        self._names: dict[str, list[commands.Command]] = {}
+        """Suggestable name (qualified name, name or alias) -> the commands it names."""
+        self._grams: dict[str, set[str]] = {}
+        """Trigram -> suggestable names containing it."""
+        self._gram_counts: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def keys_for(command: commands.Command) -> set[str]:
+        # every string that `qualified_name.endswith` would accept, plus the aliases
+        name = command.qualified_name
+        keys = {name[i:] for i in range(len(name))}
+        keys.update(command.aliases)
+        return keys
+
+    @staticmethod
+    def names_for(command: commands.Command) -> set[str]:
+        return {command.qualified_name, command.name, *command.aliases}
+
+    def add(self, command: commands.Command) -> None:
+        if command in self._keys:
+            self.remove(command)
+        keys = self.keys_for(command)
+        for key in keys:
+            self._index.setdefault(key, []).append(command)
+        self._keys[command] = keys
+
+        for name in self.names_for(command):
+            named = self._names.setdefault(name, [])
+            if not named:
+                grams = trigrams(name)
+                for gram in grams:
+                    self._grams.setdefault(gram, set()).add(name)
+                self._gram_counts[name] = len(grams)
+            named.append(command)
+
+    def add_all(self, cmds: Iterable[commands.Command]) -> None:
+        for command in cmds:
+            self.add(command)
+
+    def remove(self, command: commands.Command) -> None:
+        if command not in self._keys:
+            return
+        for key in self._keys.pop(command):
+            bucket = self._index[key]
+            bucket.remove(command)
+            if not bucket:
+                del self._index[key]
+
+        for name in self.names_for(command):
+            named = self._names.get(name)
+            if named is None or command not in named:
+                continue
+            named.remove(command)
+            if not named:
+                del self._names[name]
+                del self._gram_counts[name]
+                for gram in trigrams(name):
+                    postings = self._grams[gram]
+                    postings.discard(name)
+                    if not postings:
+                        del self._grams[gram]
+
+    def remove_all(self, cmds: Iterable[commands.Command]) -> None:
+        for command in cmds:
+            self.remove(command)
+
+    def rebuild(self, cmds: Iterable[commands.Command]) -> None:
+        self._index.clear()
+        self._keys.clear()
+        self._names.clear()
+        self._grams.clear()
+        self._gram_counts.clear()
+        self.add_all(cmds)
+
+    def resolve(self, name: str) -> list[commands.Command]:
+        """Returns every command whose qualified name ends with `name` or which has
+        `name` as an alias. An empty list means nothing matched. Every name ends
+        with `""`, so an empty `name` resolves to every command."""
+        if not name:
+            return list(self._keys)
+        return list(self._index.get(name, ()))
+
+    def suggest(
+        self, name: str, limit: int = 5, cutoff: float = 0.4
+    ) -> list[tuple[commands.Command, float]]:
+        """Returns up to `limit` commands whose names look like `name`, best first,
+        with their trigram similarity (Dice coefficient, 0-1). Only the names sharing
+        at least one trigram with `name` are scored."""
+        grams = trigrams(name)
+        shared: Counter[str] = Counter()
+        for gram in grams:
+            shared.update(self._grams.get(gram, ()))
+
+        best: dict[commands.Command, float] = {}
+        for candidate, n in shared.items():
+            score = 2 * n / (len(grams) + self._gram_counts[candidate])
+            if score < cutoff:
+                continue
+            for command in self._names[candidate]:
+                if score > best.get(command, 0):
+                    best[command] = score
+
+        ranked = sorted(best.items(), key=lambda kv: kv[1], reverse=True)
+        return ranked[:limit]
+
+    def rank(
+        self, name: str, cmds: Iterable[commands.Command]
+    ) -> list[commands.Command]:
+        """Orders `cmds` by how closely their names resemble `name`."""
+        grams = trigrams(name)
+
+        def score(command: commands.Command) -> float:
+            return max(
+                2 * len(grams & other) / (len(grams) + len(other))
+                for other in map(trigrams, self.names_for(command))
+            )
+
+        return sorted(cmds, key=score, reverse=True)
@@ -0,0 +1,39 @@
+import itertools
+import random
+import sys
+from typing import Any, Iterable, NamedTuple
+
+_PRIMITIVES = (str, bytes, int, float, tuple, list, dict, set, frozenset)
+
+
+def shallow_size(obj: Any) -> int:
+    """Size of `obj` plus the primitive values it holds directly. Other objects it
+    refers to (state, guilds, users shared with other caches) are not counted."""
+    size = sys.getsizeof(obj)
+    attrs: Iterable[Any]
+    if hasattr(obj, "__dict__"):
+        attrs = vars(obj).values()
+    else:
+        slots = itertools.chain.from_iterable(
+            getattr(cls, "__slots__", ()) for cls in type(obj).__mro__
+        )
+        attrs = (getattr(obj, name, None) for name in slots if name != "__weakref__")
+    for value in attrs:
+        if isinstance(value, _PRIMITIVES):
+            size += sys.getsizeof(value)
+    return size
+
+
+class CacheSize(NamedTuple):
+    name: str
+    count: int
+    approx_bytes: int
+
+
+def estimate(name: str, objects: list[Any], sample: int = 256) -> CacheSize:
+    """Estimates the memory held by `objects` by measuring a random sample."""
+    if not objects:
+        return CacheSize(name, 0, 0)
+    picked = random.sample(objects, min(sample, len(objects)))
+    average = sum(shallow_size(o) for o in picked) / len(picked)
+    return CacheSize(name, len(objects), int(average * len(objects)))
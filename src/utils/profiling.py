@@ -0,0 +1,66 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Optional
+
+
+def frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def collapse_frame(frame: Optional[FrameType], limit: int = 128) -> str:
+    """Formats a stack as `root;...;leaf`, the collapsed format flamegraph tools read."""
+    labels = []
+    while frame is not None and len(labels) < limit:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class StackSampler(threading.Thread):
+    """Samples the stack of another thread at a fixed interval. Unlike cProfile it
+    only sees the thread it samples, and its overhead doesn't depend on how many
+    calls that thread makes."""
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        super().__init__(name="husky-stack-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_frame(frame)] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {n}" for stack, n in self.stacks.most_common())
+
+    def hotspots(self, limit: int = 25) -> list[tuple[str, int]]:
+        """Leaf frames by number of samples, i.e. where the thread spent its time."""
+        leaves: Counter[str] = Counter()
+        for stack, n in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += n
+        return leaves.most_common(limit)
+
+
+def hotspot_table(profiler: cProfile.Profile, limit: int = 25) -> str:
+    """The `limit` hottest functions by own time, then by cumulative time."""
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out).strip_dirs()
+    for key in ("tottime", "cumulative"):
+        out.write(f"==== sorted by {key} ====\n")
+        stats.sort_stats(key).print_stats(limit)
+    return out.getvalue()
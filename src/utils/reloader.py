@@ -0,0 +1,155 @@
+import ast
+import hashlib
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from .types import LoadedFile
+
+SRC = Path(__file__).resolve().parent.parent
+RELOADABLE = ("ext", "utils")
+"""Packages under `src` whose modules can be reloaded at runtime."""
+CORE = ("cls_bot.py", "cls_ext.py")
+"""Modules that hold long-lived objects; anything they import can't be reloaded safely."""
+
+
+class ModuleInfo(NamedTuple):
+    name: str
+    """Dotted module path, e.g. `src.utils.converters`."""
+    path: Path
+    digest: str
+    imports: set[str]
+    """Dotted paths of the `src` modules this module imports."""
+
+    @property
+    def is_extension(self) -> bool:
+        return self.name.split(".")[-2] == "ext"
+
+    @property
+    def file(self) -> LoadedFile:
+        return LoadedFile(self.name, self.name[self.name.rfind(".") + 1 :])
+
+
+class ReloadResult(NamedTuple):
+    extensions: list[LoadedFile]
+    utils: list[LoadedFile]
+    skipped: list[LoadedFile]
+    """Changed modules that were not reloaded because the core depends on them."""
+
+
+def module_name(path: Path) -> str:
+    return ".".join(path.relative_to(SRC.parent).with_suffix("").parts)
+
+
+def read_imports(name: str, source: bytes) -> set[str]:
+    package = name.rsplit(".", 1)[0]
+    found = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = (
+                    package.rsplit(".", node.level - 1)[0]
+                    if node.level > 1
+                    else package
+                )
+                target = f"{base}.{node.module}" if node.module else base
+            else:
+                target = node.module or ""
+            found.add(target)
+            # `from . import x` / `from .utils import x` may import submodules
+            found.update(f"{target}.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+    return found
+
+
+def scan_module(path: Path) -> ModuleInfo:
+    source = path.read_bytes()
+    name = module_name(path)
+    return ModuleInfo(
+        name, path, hashlib.sha1(source).hexdigest(), read_imports(name, source)
+    )
+
+
+class Reloader:
+    """Tracks a content hash for every module in `src/ext` and `src/utils` and works
+    out which of them need reloading, in dependency order, when files change."""
+
+    def __init__(self) -> None:
+        self.digests: dict[str, str] = {}
+        """Module -> hash of the source that is currently loaded."""
+
+    def scan(self) -> dict[str, ModuleInfo]:
+        infos = {}
+        for package in RELOADABLE:
+            for path in sorted((SRC / package).glob("*.py")):
+                if path.name == "__init__.py":
+                    continue
+                info = scan_module(path)
+                infos[info.name] = info
+        for info in infos.values():
+            # only keep edges between modules we track
+            info.imports.intersection_update(infos)
+        return infos
+
+    def pinned(self, infos: dict[str, ModuleInfo]) -> set[str]:
+        """Tracked modules imported, directly or not, by the core modules."""
+        pending = set()
+        for name in CORE:
+            core = scan_module(SRC / name)
+            pending.update(core.imports & infos.keys())
+        found: set[str] = set()
+        while pending:
+            name = pending.pop()
+            if name not in found:
+                found.add(name)
+                pending.update(infos[name].imports)
+        return found
+
+    def changed(self, infos: dict[str, ModuleInfo]) -> set[str]:
+        return {
+            name
+            for name, info in infos.items()
+            if self.digests.get(name) != info.digest
+        }
+
+    def affected(
+        self, infos: dict[str, ModuleInfo], changed: Iterable[str]
+    ) -> list[str]:
+        """`changed` plus every module that depends on them, dependencies first."""
+        dependents: dict[str, set[str]] = {name: set() for name in infos}
+        for info in infos.values():
+            for dep in info.imports:
+                dependents[dep].add(info.name)
+
+        selected: set[str] = set()
+        pending = list(changed)
+        while pending:
+            name = pending.pop()
+            if name not in selected:
+                selected.add(name)
+                pending.extend(dependents[name])
+
+        return self.order(infos, selected)
+
+    @staticmethod
+    def order(infos: dict[str, ModuleInfo], selected: set[str]) -> list[str]:
+        ordered: list[str] = []
+        visiting: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in ordered or name in visiting:
+                return  # import cycles are broken arbitrarily
+            visiting.add(name)
+            for dep in sorted(infos[name].imports & selected):
+                visit(dep)
+            visiting.discard(name)
+            ordered.append(name)
+
+        # utils first so extensions always see the reloaded helpers
+        for name in sorted(selected, key=lambda n: (infos[n].is_extension, n)):
+            visit(name)
+        return ordered
+
+    def commit(self, infos: dict[str, ModuleInfo], names: Iterable[str]) -> None:
+        for name in names:
+            self.digests[name] = infos[name].digest
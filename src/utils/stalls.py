@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import sys
+import threading
+from time import perf_counter
+from types import CodeType, FrameType
+from typing import Iterable, NamedTuple, Optional
+from discord.ext import commands
+
+from .profiling import collapse_frame
+from .tracing import LatencyHistogram
+
+
+class StallStats:
+    __slots__ = ("command", "stack", "count", "total", "worst")
+
+    def __init__(self, command: Optional[str], stack: str):
+        self.command = command
+        """Qualified name of the command that was running, if any."""
+        self.stack = stack
+        """The loop thread's stack when the stall was noticed, in collapsed format."""
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.worst = max(self.worst, seconds)
+
+    @property
+    def leaf(self) -> str:
+        return self.stack.rsplit(";", 1)[-1]
+
+
+class _Capture(NamedTuple):
+    deadline: float
+    command: Optional[str]
+    stack: str
+
+
+class StallMonitor:
+    """Measures event loop lag with a heartbeat task, and samples the loop thread's
+    stack from a watcher thread whenever a heartbeat is more than `threshold`
+    seconds late. Samples are attributed to the command whose callback is on the
+    stack and counted per (command, stack)."""
+
+    def __init__(self, threshold: float = 0.1, interval: float = 0.05):
+        self.threshold = threshold
+        self.interval = interval
+        self.lag = LatencyHistogram()
+        """How late every heartbeat woke up, stalls or not."""
+        self.stalls: dict[tuple[Optional[str], str], StallStats] = {}
+        self._deadline = float("inf")
+        self._capture: Optional[_Capture] = None
+        self._loop_thread: Optional[int] = None
+        self.callbacks: dict[CodeType, str] = {}
+        """Command callback code -> qualified name. Replaced whole by `index` on the
+        loop thread, so the watcher thread never sees it mid-update."""
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    async def run(self) -> None:
+        """The heartbeat. Runs until cancelled, with the watcher thread alongside."""
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="husky-stall-monitor", daemon=True
+        )
+        self._thread.start()
+        try:
+            while True:
+                self._deadline = perf_counter() + self.interval
+                await asyncio.sleep(self.interval)
+                lag = max(perf_counter() - self._deadline, 0.0)
+                self.lag.record(lag)
+                capture, self._capture = self._capture, None
+                if capture is not None and lag >= self.threshold:
+                    self._record(capture, lag)
+        finally:
+            self._deadline = float("inf")
+            self._stopped.set()
+
+    def index(self, commands: Iterable[commands.Command]) -> None:
+        """Snapshots `commands` for `attribute`. Call after commands change."""
+        self.callbacks = {
+            command.callback.__code__: command.qualified_name
+            for command in commands
+            if hasattr(command.callback, "__code__")
+        }
+
+    def _watch(self) -> None:
+        try:
+            self._sample_stalls()
+        except Exception:
+            logging.exception("stall monitor thread died")
+
+    def _sample_stalls(self) -> None:
+        while not self._stopped.wait(self.threshold / 4):
+            deadline = self._deadline
+            if perf_counter() - deadline < self.threshold:
+                continue
+            if self._capture is not None and self._capture.deadline == deadline:
+                continue  # already sampled this stall
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self._capture = _Capture(
+                deadline, self.attribute(frame), collapse_frame(frame)
+            )
+
+    def attribute(self, frame: Optional[FrameType]) -> Optional[str]:
+        """The innermost command callback on the stack."""
+        callbacks = self.callbacks
+        while frame is not None:
+            name = callbacks.get(frame.f_code)
+            if name is not None:
+                return name
+            frame = frame.f_back
+        return None
+
+    def _record(self, capture: _Capture, lag: float) -> None:
+        key = (capture.command, capture.stack)
+        stats = self.stalls.get(key)
+        if stats is None:
+            stats = self.stalls[key] = StallStats(*key)
+        stats.add(lag)
+        logging.warning(
+            f"event loop blocked for {lag * 1000:.0f}ms"
+            f" in {capture.command or 'no command'} at {stats.leaf}"
+        )
+
+    def report(self) -> list[StallStats]:
+        return sorted(self.stalls.values(), key=lambda s: s.total, reverse=True)
+
+    def collapsed(self) -> str:
+        """Stall stacks weighted by milliseconds blocked, for flamegraph tools."""
+        return "\n".join(
+            f"{s.command or '(no command)'};{s.stack} {round(s.total * 1000)}"
+            for s in self.report()
+        )
+
+    def clear(self) -> None:
+        self.stalls.clear()
+        self.lag = LatencyHistogram()
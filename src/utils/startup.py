@@ -0,0 +1,78 @@
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable, Iterable, NamedTuple
+
+
+class PhaseTiming(NamedTuple):
+    name: str
+    start: float
+    """Seconds since `StartupPhases` was created."""
+    end: float
+
+
+class StartupPhases:
+    """Runs startup steps as soon as the steps they depend on are done, so
+    independent ones (importing extensions, opening the database pool) overlap.
+    Keeps when each one started and finished for `timeline`."""
+
+    def __init__(self) -> None:
+        self.origin = perf_counter()
+        self.timings: list[PhaseTiming] = []
+        self._phases: dict[
+            str, tuple[Callable[[], Awaitable[None]], tuple[str, ...]]
+        ] = {}
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[None]],
+        after: Iterable[str] = (),
+    ) -> None:
+        after = tuple(after)
+        for dependency in after:
+            if dependency not in self._phases:
+                raise ValueError(f"phase {name} depends on unknown phase {dependency}")
+        self._phases[name] = (run, after)
+
+    def mark(self, name: str) -> None:
+        """Records an instant, e.g. the gateway becoming ready."""
+        now = perf_counter() - self.origin
+        self.timings.append(PhaseTiming(name, now, now))
+
+    async def run(self) -> None:
+        """Runs every phase. If one raises, the phases still running are cancelled
+        and the exception propagates."""
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def phase(name: str) -> None:
+            run, after = self._phases[name]
+            await asyncio.gather(*(tasks[d] for d in after))
+            start = perf_counter() - self.origin
+            await run()
+            self.timings.append(PhaseTiming(name, start, perf_counter() - self.origin))
+
+        # dependencies are added first, so their tasks exist when a phase awaits them
+        for name in self._phases:
+            tasks[name] = asyncio.create_task(phase(name), name=f"startup-{name}")
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+    def timeline(self, width: int = 30) -> str:
+        total = max((t.end for t in self.timings), default=0) or 1
+        lines = ["startup timeline:"]
+        for t in sorted(self.timings, key=lambda t: t.start):
+            lead = round(t.start / total * width)
+            bar = (
+                "|"
+                if t.end == t.start
+                else "#" * max(1, round(t.end / total * width) - lead)
+            )
+            lines.append(
+                f"  {t.name:<12}{' ' * lead}{bar:<{width - lead + 1}}"
+                f"{t.start * 1000:>8.0f}ms -> {t.end * 1000:.0f}ms"
+            )
+        return "\n".join(lines)
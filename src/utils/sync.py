@@ -0,0 +1,85 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+
+class SyncDiff(NamedTuple):
+    added: list[str]
+    removed: list[str]
+    changed: list[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def describe(self) -> str:
+        parts = [
+            f"{label} {', '.join(f'`{n}`' for n in names)}"
+            for label, names in (
+                ("added", self.added),
+                ("removed", self.removed),
+                ("changed", self.changed),
+            )
+            if names
+        ]
+        return "; ".join(parts) or "no changes"
+
+
+def command_key(payload: dict[str, Any]) -> str:
+    # context menus may share a name with a slash command
+    kind = payload.get("type", 1)
+    return payload["name"] if kind == 1 else f"{payload['name']} ({kind})"
+
+
+def digest(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def hashes(payload: list[dict[str, Any]]) -> dict[str, str]:
+    """Command key -> digest of its payload, as `SyncState` stores them."""
+    return {command_key(command): digest(command) for command in payload}
+
+
+class SyncState:
+    """The per-command hashes of the application command payload as last synced,
+    kept in a JSON file so restarts (and other processes sharing the directory)
+    know whether Discord already has the current tree. Keyed by application id
+    and guild, since dev and production bots may share a checkout."""
+
+    def __init__(self, path: Path = Path(".command_sync.json")):
+        self.path = path
+
+    @staticmethod
+    def key(application_id: Optional[int], guild_id: Optional[int]) -> str:
+        return f"{application_id}:{guild_id or 'global'}"
+
+    def load(self) -> dict[str, dict[str, str]]:
+        # read every time, another process may have synced since
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"ignoring unreadable {self.path}: {e}")
+            return {}
+
+    def diff(self, key: str, new: dict[str, str]) -> Optional[SyncDiff]:
+        """What changed in `new` (see `hashes`) since it was last committed under
+        `key`, or None if it never was (so Discord's copy is unknown)."""
+        old = self.load().get(key)
+        if old is None:
+            return None
+        return SyncDiff(
+            added=sorted(new.keys() - old.keys()),
+            removed=sorted(old.keys() - new.keys()),
+            changed=sorted(n for n in new.keys() & old.keys() if new[n] != old[n]),
+        )
+
+    def commit(self, key: str, new: dict[str, str]) -> None:
+        state = self.load()
+        state[key] = new
+        temp = self.path.with_suffix(".tmp")
+        temp.write_text(json.dumps(state, indent=2, sort_keys=True))
+        temp.replace(self.path)
@@ -0,0 +1,133 @@
+import math
+from contextlib import nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from typing import TYPE_CHECKING, ContextManager, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+
+
+class LatencyHistogram:
+    """Log-scale latency histogram. Each bucket is `GROWTH` times wider than the one
+    before it, so percentiles are accurate to within a few percent while the memory
+    used stays constant no matter how many samples are recorded."""
+
+    GROWTH = 1.05
+    FLOOR = 1e-5
+    """Samples at or below this many seconds all land in bucket 0."""
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        if seconds <= self.FLOOR:
+            index = 0
+        else:
+            index = int(math.log(seconds / self.FLOOR, self.GROWTH)) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """Returns the upper bound of the bucket holding the `p`th percentile (0-100), in seconds."""
+        if self.count == 0:
+            return 0.0
+        rank = math.ceil(self.count * p / 100)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.FLOOR * self.GROWTH**index, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class SpanStats(NamedTuple):
+    command: str
+    span: str
+    histogram: LatencyHistogram
+
+
+class TraceRecorder:
+    """Aggregates finished spans per command `qualified_name` and span name.
+    Commands with `extras={"trace": False}` are not traced."""
+
+    def __init__(self) -> None:
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+
+    def record(self, command: str, span: str, seconds: float) -> None:
+        key = (command, span)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def report(self) -> list[SpanStats]:
+        return [
+            SpanStats(command, span, histogram)
+            for (command, span), histogram in sorted(self.histograms.items())
+        ]
+
+    def clear(self) -> None:
+        self.histograms.clear()
+
+
+class Span:
+    __slots__ = ("trace", "name", "started")
+
+    def __init__(self, trace: "Trace", name: str) -> None:
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self) -> "Span":
+        self.started = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.trace.recorder.record(
+            self.trace.command_name, self.name, perf_counter() - self.started
+        )
+
+
+class Trace:
+    """The spans of a single command invocation. Created by `Husky.get_context` and
+    available as `HuskyContext.trace`."""
+
+    __slots__ = ("recorder", "ctx", "started")
+
+    def __init__(self, recorder: TraceRecorder, ctx: "commands.Context") -> None:
+        self.recorder = recorder
+        self.ctx = ctx
+        self.started = perf_counter()
+
+    @property
+    def command_name(self) -> str:
+        # subcommands replace ctx.command once they are resolved, so look it up late
+        command = self.ctx.command
+        return command.qualified_name if command is not None else "<unknown>"
+
+    def span(self, name: str) -> Span:
+        return Span(self, name)
+
+    def finish(self) -> None:
+        self.recorder.record(self.command_name, "total", perf_counter() - self.started)
+
+
+current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+"""The trace of the command running in the current task, for code that has no `ctx`."""
+
+
+def span(name: str) -> ContextManager:
+    """Times the enclosed block as a sub-span of the running command, if any."""
+    trace = current_trace.get()
+    if trace is None:
+        return nullcontext()
+    return trace.span(name)
@@ -0,0 +1,162 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Optional, Protocol
+
+from .memory import CacheSize, estimate
+
+
+class ManagedView(Protocol):
+    id: str
+
+    def is_finished(self) -> bool: ...
+
+    def expire(self) -> None:
+        """Called when the view's timeout elapses. Must stop the view."""
+
+    def evict(self) -> None:
+        """Called when the view is pushed out by a cap. Must stop the view."""
+
+
+class _Entry:
+    __slots__ = ("view", "owner_id", "timeout", "expiry")
+
+    def __init__(
+        self, view: ManagedView, owner_id: Optional[int], timeout: Optional[float]
+    ):
+        self.view = view
+        self.owner_id = owner_id
+        self.timeout = timeout
+        self.expiry = time.monotonic() + timeout if timeout else None
+
+
+class ViewRegistry:
+    """Every live `HuskyView`, oldest first. Replaces discord.py's per-view timeout
+    tasks with one heap of expiry times served by `run`, and caps how many views
+    are alive at once - in total and per user - by evicting the oldest, so spamming
+    a paginator command can't grow memory without bound.
+
+    Interactions push the expiry back by adding a new heap entry rather than
+    reordering the heap; entries whose view was touched, stopped or evicted since
+    are skipped when they come up."""
+
+    def __init__(self, *, max_views: int = 1000, max_per_user: int = 5):
+        self.max_views = max_views
+        self.max_per_user = max_per_user
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._owners: dict[int, OrderedDict[str, None]] = {}
+        """Owner id -> ids of their views, oldest first."""
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def views(self) -> list[ManagedView]:
+        return [e.view for e in self._entries.values()]
+
+    def add(
+        self,
+        view: ManagedView,
+        owner_id: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Starts tracking `view`, evicting the owner's or everyone's oldest views
+        first if this one would go over a cap. A `timeout` of None never expires."""
+        if view.id in self._entries:
+            return
+
+        while owner_id in self._owners and (
+            len(owned := self._owners[owner_id]) >= self.max_per_user
+        ):
+            self._evict(next(iter(owned)))
+        while len(self._entries) >= self.max_views:
+            self._evict(next(iter(self._entries)))
+
+        entry = self._entries[view.id] = _Entry(view, owner_id, timeout)
+        if owner_id is not None:
+            self._owners.setdefault(owner_id, OrderedDict())[view.id] = None
+        self._schedule(entry)
+
+    def touch(self, view: ManagedView) -> None:
+        """Restarts `view`'s timeout, as after an interaction."""
+        entry = self._entries.get(view.id)
+        if entry is not None and entry.timeout:
+            entry.expiry = time.monotonic() + entry.timeout
+            self._schedule(entry)
+
+    def discard(self, view: ManagedView) -> None:
+        """Stops tracking `view`. Its heap entry is dropped when it comes up."""
+        entry = self._entries.pop(view.id, None)
+        if entry is None or entry.owner_id is None:
+            return
+        owned = self._owners[entry.owner_id]
+        owned.pop(view.id, None)
+        if not owned:
+            del self._owners[entry.owner_id]
+
+    def _schedule(self, entry: _Entry) -> None:
+        if entry.expiry is None:
+            return
+        if not self._heap or entry.expiry < self._heap[0][0]:
+            self._wake.set()  # `run` is sleeping towards a later expiry
+        heapq.heappush(self._heap, (entry.expiry, next(self._seq), entry.view.id))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        self._heap = [
+            (e.expiry, next(self._seq), e.view.id)
+            for e in self._entries.values()
+            if e.expiry is not None
+        ]
+        heapq.heapify(self._heap)
+
+    def _evict(self, view_id: str) -> None:
+        view = self._entries[view_id].view
+        self.discard(view)
+        self.evicted += 1
+        if not view.is_finished():
+            view.evict()
+
+    def expire_due(self) -> None:
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            expiry, _, view_id = heapq.heappop(self._heap)
+            entry = self._entries.get(view_id)
+            if entry is None or entry.expiry != expiry:
+                continue  # stopped, evicted or touched since
+            self.discard(entry.view)
+            self.expired += 1
+            if not entry.view.is_finished():
+                try:
+                    entry.view.expire()
+                except Exception:
+                    logging.exception(f"expiring view {view_id} failed")
+
+    async def run(self) -> None:
+        """Expires views as their timeouts elapse. Runs until cancelled."""
+        while True:
+            self._wake.clear()
+            if not self._heap:
+                await self._wake.wait()
+            else:
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+            self.expire_due()
+
+    def report(self) -> CacheSize:
+        return estimate("views", self.views())
+
+    def top_owners(self, n: int = 5) -> list[tuple[int, int]]:
+        return Counter({k: len(v) for k, v in self._owners.items()}).most_common(n)
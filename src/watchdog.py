@@ -12,9 +12,17 @@ class Watch(HuskyCog):
         # find tasks that are overdue
         tasks = await self.bot.db_todo.get_overdue_tasks(threshold_sec=5)
         for t in tasks:
+            # users aren't cached with the default `cache` settings, so this
+            # usually falls back to a fetch
             user = self.bot.get_user(t.user_id)
             if user is None:
-                await self.bot.db_todo.delete_user_tasks(t)
+                try:
+                    user = await self.bot.fetch_user(t.user_id)
+                except discord.NotFound:
+                    await self.bot.db_todo.delete_user_tasks(t.user_id)
+                    continue
+                except discord.HTTPException:
+                    continue  # try again next tick
 
             if t.remind_type == 1:
                 embed = self.embed(